@@ -1,11 +1,13 @@
+import asyncio
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, UploadFile, File
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 import zipfile
 import shutil
 import tempfile
@@ -13,14 +15,17 @@ import datetime
 import io
 import os
 import json
+import re
 import sqlite3
-# Try importing lancedb, but don't crash if missing (though it should be there)
+import subprocess
+import time
+import traceback
+# orjson is a faster drop-in for the JSON hot paths; fall back to stdlib json
 try:
-    import lancedb
-    import pyarrow as pa
+    import orjson
 except ImportError:
-    lancedb = None
-    pass
+    orjson = None
+import lancedb
 
 # ---------------------------
 # Path Setup
@@ -81,6 +86,9 @@ if IS_PACKAGED:
 else:
     DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Knowledge base root (SQLite metadata + Lance tables); created once here, not per request
+KB_DIR = DATA_DIR / "lancedb"
+KB_DIR.mkdir(exist_ok=True)
 
 # ---------------------------
 # Imports from Source
@@ -123,13 +131,17 @@ log_startup(f"  MUJICA_DEFAULT_MODEL = '{os.getenv('MUJICA_DEFAULT_MODEL', '<NOT
 log_startup(f"  OPENAI_BASE_URL = '{os.getenv('OPENAI_BASE_URL', '<NOT SET>')}'")
 log_startup(f"  OPENAI_API_KEY = {'***SET***' if os.getenv('OPENAI_API_KEY') else '<NOT SET>'}")
 
+from src.data_engine.storage import KnowledgeBase
+from src.utils.chat_history import list_conversations, load_conversation, delete_conversation, rename_conversation
+
 try:
     from backend.job_manager import (
         manager,
         run_plan_job,
         run_research_job,
         run_ingest_job,
-        JobBase
+        JobBase,
+        _job_update,
     )
 except ImportError:
     # Fallback for running directly from backend dir
@@ -138,28 +150,80 @@ except ImportError:
         run_plan_job,
         run_research_job,
         run_ingest_job,
-        JobBase
+        JobBase,
+        _job_update,
     )
 
+# Persistent worker pool for plan/research/ingest jobs. Workers stay alive between
+# requests, and max_workers bounds how many heavyweight jobs run at once.
+JOB_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("MUJICA_JOB_WORKERS", "8"))),
+    thread_name_prefix="mujica-job",
+)
+
+# Dedicated pool for blocking KB reads (SQLite/LanceDB) from async endpoints, so they
+# don't compete with every other sync endpoint for Starlette's shared threadpool.
+# Its threads also own the pooled read-only SQLite connections (see get_ro_conn).
+KB_IO_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("MUJICA_KB_IO_WORKERS", "8"))),
+    thread_name_prefix="mujica-kb",
+)
+
+def _submit_job(job: JobBase, fn, **kwargs) -> None:
+    """Queue a job runner on JOB_POOL and keep its future on the job."""
+    _job_update(job, stage="queued", message="Waiting for a free worker...")
+    job.future = JOB_POOL.submit(fn, job=job, **kwargs)
+    job.future.add_done_callback(lambda f: _on_job_future_done(job, f))
+
+def _on_job_future_done(job: JobBase, future) -> None:
+    # The runners record their own errors; this only catches anything that escaped them,
+    # which the executor would otherwise swallow silently.
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        print(f"[JobPool] Job {job.job_id} crashed: {exc!r}")
+        _job_update(job, status="error", stage="error", message="Failed ❌", error=str(exc), finished_ts=time.time())
+
+async def run_kb_io(fn, *args):
+    """Run a blocking KB call on KB_IO_POOL and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(KB_IO_POOL, fn, *args)
+
 # ---------------------------
 # App & CORS
 # ---------------------------
 app = FastAPI(title="MUJICA Backend API")
 
+@app.on_event("shutdown")
+def _shutdown_pools():
+    # Match the old daemon-thread behaviour: don't block exit on running jobs
+    JOB_POOL.shutdown(wait=False, cancel_futures=True)
+    KB_IO_POOL.shutdown(wait=False, cancel_futures=True)
+
+# The only client is our renderer: the Vite dev server in development, and a
+# file:// page once packaged (browsers send "Origin: null" for those).
+# MUJICA_CORS_ORIGINS (comma-separated) adds extra origins, e.g. another dev port.
+CORS_ORIGINS = ["http://localhost:5173", "http://127.0.0.1:5173", "null"]
+CORS_ORIGINS += [o.strip() for o in os.getenv("MUJICA_CORS_ORIGINS", "").split(",") if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["Content-Length", "Content-Disposition"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,  # no cookies/auth headers are used
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # ---------------------------
 # Pydantic Models
 # ---------------------------
+# Request bodies come from our own renderer: unknown fields are dropped, and the
+# parsed models are read-only so handlers can't mutate them by accident.
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 class PlanRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     query: str
     # These are optional overrides - backend will use env vars if not provided
     model_name: Optional[str] = None
@@ -168,6 +232,8 @@ class PlanRequest(BaseModel):
     stats: Dict[str, Any] = {}
 
 class ResearchRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     plan: Dict[str, Any]
     # These are optional overrides - backend will use env vars if not provided
     model_name: Optional[str] = None
@@ -178,6 +244,8 @@ class ResearchRequest(BaseModel):
     embedding_base_url: Optional[str] = None
 
 class IngestRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     venue_id: str
     limit: Optional[int] = 50
     accepted_only: bool = False
@@ -196,182 +264,250 @@ class JobResponse(BaseModel):
     status: str
     type: str
 
-# ---------------------------
-# Endpoints
-# ---------------------------
-
-# ---------------------------
-# Extended Imports for Feature Parity
-# ---------------------------
-import os
-import shutil
-from src.utils.llm import get_llm_client
-from src.data_engine.storage import KnowledgeBase
-from src.utils.chat_history import list_conversations, load_conversation, delete_conversation, rename_conversation
-try:
-    from backend.job_manager import manager
-except ImportError:
-    from job_manager import manager
-
 # ---------------------------
 # Helpers
 # ---------------------------
+# Serializes .env read-modify-write cycles: update_config runs on the threadpool, and two
+# concurrent saves would otherwise race on the same .tmp file and drop each other's keys
+_env_lock = threading.Lock()
+
 def _update_env_file(updates: Dict[str, str]):
     """Update .env file in user config directory (not installation dir)."""
     env_path = USER_ENV_PATH  # Use user directory instead of PROJECT_ROOT
-    
-    if not env_path.exists():
-        # Create new if not exists
-        with open(env_path, "w", encoding="utf-8") as f:
-            for k, v in updates.items():
-                f.write(f"{k}={v}\n")
+
+    with _env_lock:
+        lines = []
+        if env_path.exists():
+            with open(env_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+
+        # Rewrite matching keys in place; whatever is left in `pending` gets appended
+        pending = dict(updates)
+        new_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#") and "=" in stripped:
+                key = stripped.split("=", 1)[0].strip()
+                if key in pending:
+                    new_lines.append(f"{key}={pending.pop(key)}\n")
+                    continue
+            new_lines.append(line)
+
+        if new_lines and not new_lines[-1].endswith("\n"):
+            new_lines[-1] += "\n"
+        new_lines.extend(f"{k}={v}\n" for k, v in pending.items())
+
+        # Saving the same settings twice is common; only touch the disk when something changed.
+        # Write to a sibling temp file and swap it in, so a crash never leaves a torn .env
+        if new_lines != lines:
+            tmp_path = env_path.with_name(env_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(new_lines)
+            os.replace(tmp_path, env_path)
+
         # Also update current process env
         for k, v in updates.items():
             os.environ[k] = str(v)
-        return
 
-    # Read existing lines
-    lines = []
-    with open(env_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+# Secrets are never echoed back to the UI: /api/config returns "" for them and the form
+# shows the *_SET flags as a hint instead. A value made only of asterisks (the old
+# "********" placeholder, or a partial edit of it from a stale form) means "unchanged".
+_SECRET_KEYS = ("OPENAI_API_KEY", "MUJICA_EMBEDDING_API_KEY", "OPENREVIEW_PASSWORD")
 
-    # Process updates
-    new_lines = []
-    updated_keys = set()
-    
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            new_lines.append(line)
-            continue
-        
-        # Parse key
-        if "=" in stripped:
-            key = stripped.split("=", 1)[0].strip()
-            if key in updates:
-                new_lines.append(f"{key}={updates[key]}\n")
-                updated_keys.add(key)
-            else:
-                new_lines.append(line)
-        else:
-            new_lines.append(line)
-            
-    # Append new keys
-    for k, v in updates.items():
-        if k not in updated_keys:
-            new_lines.append(f"\n{k}={v}\n")
-            
-    with open(env_path, "w", encoding="utf-8") as f:
-        f.writelines(new_lines)
-    
-    # Also update current process env
-    for k, v in updates.items():
-        os.environ[k] = str(v)
+def _unmask(value: Optional[str]) -> Optional[str]:
+    if isinstance(value, str) and value and not value.strip("*"):
+        return None
+    return value
 
 # ---------------------------
 # Global Services
 # ---------------------------
 # Shared KB instance for read operations (listing papers etc)
-# We lazily init it to avoid startup blocking
+# We lazily init it to avoid startup blocking. All access goes through _kb_lock so
+# concurrent requests can't initialize two KnowledgeBase objects side by side.
+_kb_lock = threading.RLock()
 _kb_instance: Optional[KnowledgeBase] = None
+_kb_version = 0
 
 def get_kb(force_refresh: bool = False) -> KnowledgeBase:
     """Get KB instance, optionally forcing a fresh connection for updated data."""
+    global _kb_instance, _kb_version
+    with _kb_lock:
+        if _kb_instance is None or force_refresh:
+            # Use absolute path for data directory
+            kb_path = str(KB_DIR)
+            kb = KnowledgeBase(db_path=kb_path)
+            kb.initialize_db()
+            _kb_instance = kb
+            _kb_version += 1
+        return _kb_instance
+
+def _mark_kb_stale() -> None:
+    """Drop the cached KB; it (and pooled read connections) reopen on next use."""
     global _kb_instance
-    if _kb_instance is None or force_refresh:
-        # Use absolute path for data directory
-        kb_path = str(DATA_DIR / "lancedb")
-        _kb_instance = KnowledgeBase(db_path=kb_path)
-        _kb_instance.initialize_db()
-    return _kb_instance
+    with _kb_lock:
+        _kb_instance = None
 
 def refresh_kb():
     """Force refresh of KB instance to see latest data."""
-    global _kb_instance
-    _kb_instance = None
-    return get_kb()
+    with _kb_lock:
+        _mark_kb_stale()
+        return get_kb()
+
+# Per-thread read-only SQLite connections for the KB read endpoints. Starlette's
+# threadpool and the job pool reuse threads, so each keeps one open connection
+# instead of paying connect()/close() on every request.
+# A connection opened against an older KB generation (_kb_version) is reopened.
+_sqlite_pool = threading.local()
+
+def get_ro_conn(path: str) -> sqlite3.Connection:
+    """Return this thread's read-only connection to `path`, opening it on first use."""
+    conn = getattr(_sqlite_pool, "conn", None)
+    if conn is not None:
+        if _sqlite_pool.path == path and _sqlite_pool.gen == _kb_version:
+            return conn
+        try:
+            conn.close()
+        except Exception:
+            pass
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    # Per-connection tuning (journal_mode/synchronous live on the writer side, see storage.py)
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    _sqlite_pool.conn, _sqlite_pool.path, _sqlite_pool.gen = conn, path, _kb_version
+    return conn
 
 # ---------------------------
 # Endpoints
 # ---------------------------
 
 @app.get("/")
-def health_check():
+async def health_check():
     return {"status": "ok", "service": "MUJICA Backend"}
 
 @app.get("/api/jobs")
-def list_jobs():
+async def list_jobs():
     """List all jobs (summary)"""
-    with manager._lock:
-        return {
-            "jobs": [
-                {
-                    "job_id": j.job_id,
-                    "type": j.type,
-                    "status": j.status,
-                    "message": j.message,
-                    "started_ts": j.started_ts
-                }
-                for j in manager.jobs.values()
-            ]
-        }
+    return {
+        "jobs": [
+            {"job_id": j.job_id, "type": j.type, "status": j.status, "message": j.message, "started_ts": j.started_ts}
+            for j in manager.list_jobs()
+        ]
+    }
 
 @app.get("/api/jobs/{job_id}")
-def get_job_status(job_id: str):
+async def get_job_status(job_id: str):
     """Get detailed job status"""
     job = manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job.to_dict()
 
+# DELETE is the REST form; the renderer posts to /api/job/{id}/cancel. Both share one handler,
+# and the body carries the keys each form has historically returned.
 @app.delete("/api/jobs/{job_id}")
-def cancel_job(job_id: str):
+@app.post("/api/job/{job_id}/cancel")
+async def cancel_job(job_id: str):
     """Cancel a running job"""
     if manager.cancel_job(job_id):
-        return {"status": "cancelled_requested"}
+        return {"status": "cancelled_requested", "ok": True, "message": "Cancel signal sent"}
     raise HTTPException(status_code=404, detail="Job not found")
 
-@app.post("/api/plan", response_model=JobResponse)
-def start_plan(req: PlanRequest, background_tasks: BackgroundTasks):
-    job = manager.create_job("plan")
-    
-    # Enrich stats with DB reality (Rating range, etc)
-    kb = get_kb(force_refresh=True) # Ensure fresh connection
+# Planner enrichment stats barely change between /api/plan calls; cache them briefly
+# and bust the cache whenever the KB is refreshed, a paper is deleted or an ingest ends.
+# Entries also remember a stamp of the KB files, so writes from anywhere (CLI ingest,
+# another process) invalidate them without waiting for the TTL.
+_stats_cache: Dict[str, Any] = {"ts": 0.0, "stamp": None, "data": None}
+_STATS_TTL = 30.0
+
+# /api/kb/stats is polled by the UI; same idea with a shorter TTL.
+_kb_stats_cache: Dict[str, Any] = {"ts": 0.0, "stamp": None, "value": None}
+_KB_STATS_TTL = 5.0
+
+def _kb_data_stamp() -> tuple:
+    """(mtime_ns, size) of the SQLite file, its WAL and the chunks version dir; changes on write."""
+    kb_path = KB_DIR
+    stamp = []
+    for p in (kb_path / "metadata.sqlite", kb_path / "metadata.sqlite-wal", kb_path / "chunks.lance" / "_versions"):
+        try:
+            st = p.stat()
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _cache_fresh(cache: Dict[str, Any], key: str, ttl: float, stamp: tuple) -> bool:
+    return cache[key] is not None and cache["stamp"] == stamp and time.monotonic() - cache["ts"] < ttl
+
+def _invalidate_stats_cache() -> None:
+    _stats_cache["ts"] = 0.0
+    _kb_stats_cache["ts"] = 0.0
+
+def _on_job_complete(job: JobBase) -> None:
+    # The shared KB doesn't need reopening after an ingest: SQLite (WAL) readers see
+    # committed rows and LanceDB's open_table() reads the latest table version. Only
+    # the derived caches are stale.
+    if job.type == "ingest":
+        _invalidate_stats_cache()
+
+manager.on_job_complete(_on_job_complete)
+
+def _get_enrich_stats() -> Dict[str, Any]:
+    """Return cached planner enrichment stats, recomputing them once the TTL expires."""
+    stamp = _kb_data_stamp()
+    if _cache_fresh(_stats_cache, "data", _STATS_TTL, stamp):
+        return dict(_stats_cache["data"])
+    data = _collect_plan_stats()
+    if data:
+        _stats_cache.update(ts=time.monotonic(), stamp=stamp, data=data)
+    return dict(data)
+
+_PLAN_STATS_SQL = """
+SELECT
+  COUNT(*), MIN(rating), MAX(rating), AVG(rating),
+  (SELECT json_group_array(year) FROM
+     (SELECT DISTINCT year FROM papers WHERE year IS NOT NULL ORDER BY year)),
+  (SELECT json_group_array(decision) FROM
+     (SELECT DISTINCT decision FROM papers WHERE decision IS NOT NULL LIMIT 20)),
+  (SELECT json_group_array(venue_id) FROM
+     (SELECT DISTINCT venue_id FROM papers WHERE venue_id IS NOT NULL LIMIT 10))
+FROM papers
+"""
+
+def _collect_plan_stats() -> Dict[str, Any]:
+    """Enrich planner stats with DB reality (rating range, years, venues...)."""
+    kb = get_kb()
     enrich_stats = {}
     if kb and kb._meta_conn:
         try:
-            # Create fresh cursor/connection if necessary, but kb._meta_conn is persistent in app context usually
-            # But earlier we said it's thread-unsafe. get_kb() returns the global instance.
-            # Ideally we generate a transient connection or use the one if safe.
-            # Let's use a fresh connection to be safe as this runs in main thread (FastAPI worker)
-            import sqlite3
-            with sqlite3.connect(kb.metadata_path) as conn:
-                # 1. Basic Stats
-                row = conn.execute("SELECT COUNT(*), MIN(rating), MAX(rating), AVG(rating) FROM papers").fetchone()
-                
-                # 2. Distinct Years
-                years = [r[0] for r in conn.execute("SELECT DISTINCT year FROM papers WHERE year IS NOT NULL ORDER BY year").fetchall()]
-                
-                # 3. Distinct Decisions
-                decisions = [r[0] for r in conn.execute("SELECT DISTINCT decision FROM papers WHERE decision IS NOT NULL LIMIT 20").fetchall()]
-                
-                # 4. Distinct Venues (Top 5)
-                venues = [r[0] for r in conn.execute("SELECT DISTINCT venue_id FROM papers WHERE venue_id IS NOT NULL LIMIT 10").fetchall()]
-                
-                enrich_stats = {
-                    "paper_count": row[0],
-                    "min_rating": row[1],
-                    "max_rating": row[2],
-                    "avg_rating": row[3],
-                    "years": years,
-                    "decisions": decisions,
-                    "venues": venues,
-                }
+            # kb._meta_conn is shared and not thread-safe; this runs in a worker thread,
+            # so read through that thread's pooled connection instead.
+            conn = get_ro_conn(kb.metadata_path)
+            # One statement, one row: aggregates plus the distinct lists as JSON arrays
+            count, min_r, max_r, avg_r, years, decisions, venues = conn.execute(_PLAN_STATS_SQL).fetchone()
+            enrich_stats = {
+                "paper_count": count,
+                "min_rating": min_r,
+                "max_rating": max_r,
+                "avg_rating": avg_r,
+                "years": _parse_json_list(years),
+                "decisions": _parse_json_list(decisions),
+                "venues": _parse_json_list(venues),
+            }
         except Exception as e:
             print(f"Error getting detailed stats: {e}")
+    return enrich_stats
+
+@app.post("/api/plan", response_model=JobResponse)
+async def start_plan(req: PlanRequest, background_tasks: BackgroundTasks):
+    job = manager.create_job("plan")
+    
+    # SQLite/LanceDB work is blocking; keep it off the event loop
+    enrich_stats = await run_kb_io(_get_enrich_stats)
 
-    final_stats = req.stats or {}
-    final_stats.update(enrich_stats)
+    final_stats = {**req.stats, **enrich_stats}
 
     # Backend reads config directly from env vars (primary source)
     # Frontend values only override if explicitly provided and non-empty
@@ -384,32 +520,26 @@ def start_plan(req: PlanRequest, background_tasks: BackgroundTasks):
         model_name = req.model_name
     if req.base_url:
         base_url = req.base_url
-    if req.api_key:
+    if _unmask(req.api_key):
         api_key = req.api_key
     
     print(f"[API /api/plan] Using: model='{model_name}', base_url='{base_url[:30] if base_url else 'unset'}...'")
 
-    # Run in background thread (managed by logic inside job_manager to allow cancellation)
-    # But since run_plan_job is synchronous, we wrap it in a thread here
-    t = threading.Thread(
-        target=run_plan_job,
-        kwargs={
-            "job": job,
-            "user_query": req.query,
-            "model_name": model_name,
-            "api_key": api_key,
-            "base_url": base_url,
-            "stats": final_stats
-        },
-        daemon=True
+    # run_plan_job is synchronous; hand it to the job pool (cancellation via job.cancel_event)
+    _submit_job(
+        job,
+        run_plan_job,
+        user_query=req.query,
+        model_name=model_name,
+        api_key=api_key,
+        base_url=base_url,
+        stats=final_stats,
     )
-    job.thread = t
-    t.start()
     
     return {"job_id": job.job_id, "status": "init", "type": "plan"}
 
 @app.post("/api/research", response_model=JobResponse)
-def start_research(req: ResearchRequest, background_tasks: BackgroundTasks):
+async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks):
     job = manager.create_job("research")
     
     # Backend reads config directly from env vars (primary source)
@@ -423,72 +553,65 @@ def start_research(req: ResearchRequest, background_tasks: BackgroundTasks):
     # Allow frontend override only if user explicitly set something different
     if req.model_name and req.model_name not in {'gpt-4o', 'deepseek-chat', ''}:
         model_name = req.model_name
-    if req.chat_api_key:
+    if _unmask(req.chat_api_key):
         chat_api_key = req.chat_api_key
     if req.chat_base_url:
         chat_base_url = req.chat_base_url
     if req.embedding_model:
         embedding_model = req.embedding_model
-    if req.embedding_api_key:
+    if _unmask(req.embedding_api_key):
         embedding_api_key = req.embedding_api_key
     if req.embedding_base_url:
         embedding_base_url = req.embedding_base_url
     
     print(f"[API /api/research] Using: model='{model_name}', embedding='{embedding_model}'")
     
-    t = threading.Thread(
-        target=run_research_job,
-        kwargs={
-            "job": job,
-            "plan": req.plan,
-            "model_name": model_name,
-            "chat_api_key": chat_api_key,
-            "chat_base_url": chat_base_url,
-            "embedding_model": embedding_model,
-            "embedding_api_key": embedding_api_key,
-            "embedding_base_url": embedding_base_url,
-        },
-        daemon=True
+    _submit_job(
+        job,
+        run_research_job,
+        plan=req.plan,
+        model_name=model_name,
+        chat_api_key=chat_api_key,
+        chat_base_url=chat_base_url,
+        embedding_model=embedding_model,
+        embedding_api_key=embedding_api_key,
+        embedding_base_url=embedding_base_url,
     )
-    job.thread = t
-    t.start()
     
     return {"job_id": job.job_id, "status": "init", "type": "research"}
 
 @app.post("/api/ingest", response_model=JobResponse)
-def start_ingest(req: IngestRequest, background_tasks: BackgroundTasks):
+async def start_ingest(req: IngestRequest, background_tasks: BackgroundTasks):
     job = manager.create_job("ingest")
     
-    t = threading.Thread(
-        target=run_ingest_job,
-        kwargs={
-            "job": job,
-            "venue_id": req.venue_id,
-            "limit": req.limit,
-            "accepted_only": req.accepted_only,
-            "presentation_in": req.presentation_in,
-            "skip_existing": req.skip_existing,
-            "download_pdfs": req.download_pdfs,
-            "parse_pdfs": req.parse_pdfs,
-            "max_pdf_pages": req.max_pdf_pages,
-            "max_downloads": req.max_downloads,
-            "embedding_model": req.embedding_model,
-            "embedding_api_key": req.embedding_api_key,
-            "embedding_base_url": req.embedding_base_url,
-        },
-        daemon=True
+    _submit_job(
+        job,
+        run_ingest_job,
+        venue_id=req.venue_id,
+        limit=req.limit,
+        accepted_only=req.accepted_only,
+        presentation_in=req.presentation_in,
+        skip_existing=req.skip_existing,
+        download_pdfs=req.download_pdfs,
+        parse_pdfs=req.parse_pdfs,
+        max_pdf_pages=req.max_pdf_pages,
+        max_downloads=req.max_downloads,
+        embedding_model=req.embedding_model,
+        embedding_api_key=_unmask(req.embedding_api_key),
+        embedding_base_url=req.embedding_base_url,
     )
-    job.thread = t
-    t.start()
     
     return {"job_id": job.job_id, "status": "init", "type": "ingest"}
 
 @app.get("/api/kb/stats")
-def get_kb_stats():
+async def get_kb_stats():
     """Get knowledge base statistics"""
-    import sqlite3
-    import lancedb
-    
+    stamp = _kb_data_stamp()
+    if _cache_fresh(_kb_stats_cache, "value", _KB_STATS_TTL, stamp):
+        return dict(_kb_stats_cache["value"])
+    return await run_kb_io(_get_kb_stats_sync, stamp)
+
+def _get_kb_stats_sync(stamp: tuple):
     result = {"papers": 0, "reviews": 0, "chunks": 0}
     kb = get_kb()
     
@@ -498,11 +621,9 @@ def get_kb_stats():
     
     if meta_path and os.path.exists(meta_path):
         try:
-            conn = sqlite3.connect(meta_path)
-            # Use read-only mode if possible, but standard connect is fine for WAL mode
+            conn = get_ro_conn(meta_path)
             result["papers"] = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
             result["reviews"] = conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
-            conn.close()
         except Exception as e:
             print(f"[KB Stats] Error querying SQLite ({meta_path}): {e}")
     else:
@@ -519,23 +640,47 @@ def get_kb_stats():
         except Exception as e:
             print(f"[KB Stats] Error querying LanceDB ({db_path}): {e}")
 
+    _kb_stats_cache.update(ts=time.monotonic(), stamp=stamp, value=dict(result))
     return result
 
-@app.post("/api/job/{job_id}/cancel")
-def cancel_job(job_id: str):
-    """Cancel a running job"""
-    if manager.cancel_job(job_id):
-        return {"ok": True, "message": "Cancel signal sent"}
-    return {"ok": False, "message": "Job not found or not cancellable"}
+def _prewarm_kb() -> None:
+    """Open the KB and touch SQLite/LanceDB once so the first real request doesn't pay for it."""
+    t0 = time.monotonic()
+    try:
+        kb = get_kb()
+        get_ro_conn(kb.metadata_path).execute("SELECT COUNT(*) FROM papers").fetchone()
+        if kb.db is not None and kb.chunks_table in kb.db.table_names():
+            tbl = kb.db.open_table(kb.chunks_table)
+            if "vector" in tbl.schema.names:
+                dim = int(tbl.schema.field("vector").type.list_size)
+                if dim > 0:
+                    # Zero-vector probe: loads index/fragment metadata without an embedding call
+                    tbl.search([0.0] * dim).limit(1).to_list()
+        log_startup(f"[STARTUP] KB pre-warmed in {time.monotonic() - t0:.2f}s")
+    except Exception as e:
+        log_startup(f"[STARTUP] KB pre-warm skipped: {e}")
+
+@app.on_event("startup")
+async def _schedule_kb_prewarm():
+    # Fire and forget on the KB pool: startup isn't delayed, and a request that arrives
+    # early simply waits on _kb_lock for the same initialization.
+    if os.getenv("MUJICA_PREWARM_KB", "1") != "0":
+        asyncio.get_running_loop().run_in_executor(KB_IO_POOL, _prewarm_kb)
 
 # ---------------------------
 # Feature Parity API (KB/Config/History)
 # ---------------------------
 
 @app.post("/api/kb/refresh")
-def refresh_kb_endpoint():
+async def refresh_kb_endpoint():
     """Force refresh KB connection to see latest data."""
+    return await run_kb_io(_refresh_kb_sync)
+
+def _refresh_kb_sync():
     kb = refresh_kb()
+    # KBs that grew past the ANN threshold before indexing existed get their index here
+    kb.ensure_chunk_index()
+    _invalidate_stats_cache()
     paper_count = 0
     if kb._meta_conn:
         try:
@@ -543,95 +688,145 @@ def refresh_kb_endpoint():
         except: pass
     return {"ok": True, "papers": paper_count}
 
+# Column order shared by the SELECTs below and the row factories that turn each row into a dict
+_PAPER_LIST_COLS = ("id", "title", "year", "venue_id", "decision", "rating", "pdf_path")
+_REVIEW_COLS = (
+    "idx", "rating", "rating_raw", "confidence", "confidence_raw",
+    "summary", "strengths", "weaknesses", "text",
+)
+
+def _dict_row_factory(cols):
+    """Cursor row_factory building plain dicts straight from the row tuple (no sqlite3.Row hop)."""
+    def factory(cursor, row):
+        return dict(zip(cols, row))
+    return factory
+
+_paper_list_row = _dict_row_factory(_PAPER_LIST_COLS)
+_review_row = _dict_row_factory(_REVIEW_COLS)
+
+def _fts_match_query(search: str) -> Optional[str]:
+    """Turn free text into an FTS5 MATCH expression: every word as a quoted prefix term."""
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        return None
+    return " ".join(f'"{t}"*' for t in terms)
+
 @app.get("/api/kb/papers")
-def list_papers(limit: int = 100, search: Optional[str] = None):
-    """List papers from SQLite - always use fresh connection"""
+async def list_papers(limit: int = 100, search: Optional[str] = None):
+    """List papers from SQLite via this thread's pooled read connection"""
+    return await run_kb_io(_list_papers_sync, limit, search)
+
+def _list_papers_sync(limit: int = 100, search: Optional[str] = None):
     try:
-        kb = get_kb(force_refresh=True)
+        kb = get_kb()
         if not kb or not kb._meta_conn:
             print("[ListPapers] KB or connection not initialized")
             return {"papers": []}
         
-        cur = kb._meta_conn.cursor()
-        query = "SELECT id, title, year, venue_id, decision, rating, pdf_path FROM papers"
+        # Don't touch kb._meta_conn here: it belongs to whichever thread created it
+        cur = get_ro_conn(kb.metadata_path).cursor()
+        cur.row_factory = _paper_list_row
+
+        # Full-text path first; LIKE below stays as the fallback (no FTS5, CJK substrings, no hits)
+        match = _fts_match_query(search) if search else None
+        if match:
+            try:
+                rows = cur.execute(
+                    f"""SELECT {', '.join('p.' + c for c in _PAPER_LIST_COLS)}
+                       FROM papers_fts f JOIN papers p ON p.rowid = f.rowid
+                       WHERE papers_fts MATCH ? ORDER BY rank LIMIT ?""",
+                    (match, limit),
+                ).fetchall()
+                if rows:
+                    return {"papers": rows}
+            except sqlite3.OperationalError as e:
+                print(f"[ListPapers] FTS search failed, falling back to LIKE: {e}")
+
+        query = f"SELECT {', '.join(_PAPER_LIST_COLS)} FROM papers"
         params = []
         
         if search:
-            query += " WHERE title LIKE ? OR abstract LIKE ?"
-            params.extend([f"%{search}%", f"%{search}%"])
+            # search_blob is title+abstract in one column, so this is a single LIKE per row
+            query += " WHERE search_blob LIKE ?"
+            params.append(f"%{search}%")
         
         query += " ORDER BY updated_at DESC LIMIT ?"
         params.append(limit)
         
-        rows = cur.execute(query, params).fetchall()
-        return {"papers": [dict(r) for r in rows]}
+        return {"papers": cur.execute(query, params).fetchall()}
     except Exception as e:
-        import traceback
         print(f"[ListPapers] Error: {e}")
         traceback.print_exc()
         raise HTTPException(500, f"Failed to list papers: {str(e)}")
 
 @app.get("/api/kb/semantic-search")
-def semantic_search_papers(query: str = Query(..., min_length=1), limit: int = 20):
+async def semantic_search_papers(query: str = Query(..., min_length=1), limit: int = 20):
     """
     Semantic search using vector embeddings.
     Returns papers ranked by similarity to the query.
     """
-    from src.data_engine.storage import KnowledgeBase
-    
-    kb = get_kb(force_refresh=True)
+    return await run_kb_io(_semantic_search_papers_sync, query, limit)
+
+def _semantic_search_papers_sync(query: str, limit: int = 20):
+    kb = get_kb()
     
     try:
         # Use search_chunks for chunk-level semantic search
         results = kb.search_chunks(query, limit=limit)
         
-        # Deduplicate by paper_id and aggregate scores
-        papers_map = {}
+        # LanceDB returns hits ordered by ascending distance, so the first hit per paper is
+        # its best chunk: dedup is a single pass, and the output is already sorted.
+        papers = []
+        seen = set()
         for r in results:
             paper_id = r.get("paper_id")
-            if not paper_id:
+            if not paper_id or paper_id in seen:
                 continue
-            
-            distance = r.get("_distance", 1.0)
+            seen.add(paper_id)
+
+            distance = r.get("_distance")
             # Convert distance to similarity (LanceDB uses L2 distance)
-            similarity = max(0, 1 - distance) if distance else 0.5
-            
-            if paper_id not in papers_map:
-                papers_map[paper_id] = {
-                    "id": paper_id,
-                    "title": r.get("title", ""),
-                    "year": r.get("year"),
-                    "venue_id": r.get("venue_id"),
-                    "decision": r.get("decision"),
-                    "rating": r.get("rating"),
-                    "similarity": similarity,
-                    "matched_chunk": r.get("text", "")[:200] + "..." if r.get("text") else "",
-                    "source": r.get("source", ""),
-                }
-            else:
-                # Keep the higher similarity score
-                if similarity > papers_map[paper_id]["similarity"]:
-                    papers_map[paper_id]["similarity"] = similarity
-                    papers_map[paper_id]["matched_chunk"] = r.get("text", "")[:200] + "..." if r.get("text") else ""
-        
-        # Sort by similarity descending
-        papers = sorted(papers_map.values(), key=lambda x: x["similarity"], reverse=True)
+            similarity = max(0, 1 - distance) if distance is not None else 0.5
+            text = r.get("text")
+            papers.append({
+                "id": paper_id,
+                "title": r.get("title", ""),
+                "year": r.get("year"),
+                "venue_id": r.get("venue_id"),
+                "decision": r.get("decision"),
+                "rating": r.get("rating"),
+                "similarity": similarity,
+                "matched_chunk": text[:200] + "..." if text else "",
+                "source": r.get("source", ""),
+            })
         
         return {"papers": papers, "mode": "semantic"}
     except Exception as e:
         print(f"[Semantic Search] Error: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(500, f"Semantic search failed: {e}")
 
+def _parse_json_list(raw: Optional[str]) -> List[Any]:
+    """Decode a *_json list column; anything empty or malformed becomes []."""
+    if not raw:
+        return []
+    try:
+        value = orjson.loads(raw) if orjson else json.loads(raw)
+    except ValueError:
+        return []
+    return value if isinstance(value, list) else []
+
 @app.get("/api/kb/paper/{paper_id}")
-def get_paper_detail(paper_id: str):
+async def get_paper_detail(paper_id: str):
     """Get full paper details including reviews"""
+    return await run_kb_io(_get_paper_detail_sync, paper_id)
+
+def _get_paper_detail_sync(paper_id: str):
     kb = get_kb()
     if not kb._meta_conn:
         raise HTTPException(404, "KB not initialized")
     
-    cur = kb._meta_conn.cursor()
+    cur = get_ro_conn(kb.metadata_path).cursor()
     
     # Fetch paper
     paper_row = cur.execute(
@@ -647,27 +842,25 @@ def get_paper_detail(paper_id: str):
     
     paper = dict(paper_row)
     
-    # Parse JSON fields
-    import json
-    try:
-        paper["authors"] = json.loads(paper.get("authors_json") or "[]")
-    except:
-        paper["authors"] = []
+    # Authors come pre-split from paper_authors; authors_json is the fallback for KBs without it
     try:
-        paper["keywords"] = json.loads(paper.get("keywords_json") or "[]")
-    except:
-        paper["keywords"] = []
+        paper["authors"] = [
+            r[0] for r in cur.execute(
+                "SELECT name FROM paper_authors WHERE paper_id = ? ORDER BY idx", (paper_id,)
+            )
+        ]
+    except sqlite3.OperationalError:
+        paper["authors"] = _parse_json_list(paper.get("authors_json"))
+    paper["keywords"] = _parse_json_list(paper.get("keywords_json"))
     
     # Fetch reviews
-    review_rows = cur.execute(
-        """SELECT idx, rating, rating_raw, confidence, confidence_raw,
-                  summary, strengths, weaknesses, text
-           FROM reviews WHERE paper_id = ? ORDER BY idx""",
+    review_cur = cur.connection.cursor()
+    review_cur.row_factory = _review_row
+    paper["reviews"] = review_cur.execute(
+        f"SELECT {', '.join(_REVIEW_COLS)} FROM reviews WHERE paper_id = ? ORDER BY idx",
         (paper_id,)
     ).fetchall()
     
-    paper["reviews"] = [dict(r) for r in review_rows]
-    
     return paper
 
 @app.post("/api/kb/delete")
@@ -679,124 +872,138 @@ def delete_paper(paper_id: str = Query(..., description="Paper ID to delete")):
     
     # 1. SQLite
     try:
-        cur = kb._meta_conn.cursor()
-        cur.execute("DELETE FROM papers WHERE id = ?", (paper_id,))
-        cur.execute("DELETE FROM reviews WHERE paper_id = ?", (paper_id,))
-        kb._meta_conn.commit()
+        # Short-lived writer: kb._meta_conn may belong to another thread
+        conn = sqlite3.connect(kb.metadata_path)
+        try:
+            with conn:
+                conn.execute("DELETE FROM papers WHERE id = ?", (paper_id,))
+                conn.execute("DELETE FROM reviews WHERE paper_id = ?", (paper_id,))
+        finally:
+            conn.close()
     except Exception as e:
         raise HTTPException(500, f"SQLite delete failed: {e}")
         
     # 2. LanceDB
+    # LanceDB filters have no bind parameters; escape quotes the same way storage.delete_paper does
+    safe_pid = paper_id.replace("'", "''")
     try:
-        if kb.papers_table in kb.db.table_names():
-            kb.db.open_table(kb.papers_table).delete(f"id = '{paper_id}'")
-        if kb.chunks_table in kb.db.table_names():
-            kb.db.open_table(kb.chunks_table).delete(f"paper_id = '{paper_id}'")
+        tables = kb.db.table_names()
+        if kb.papers_table in tables:
+            kb.db.open_table(kb.papers_table).delete(f"id = '{safe_pid}'")
+        if kb.chunks_table in tables:
+            kb.db.open_table(kb.chunks_table).delete(f"paper_id = '{safe_pid}'")
     except Exception as e:
         print(f"LanceDB delete failed (non-fatal): {e}")
-        
+
+    _invalidate_stats_cache()
     return {"status": "ok"}
 
-@app.get("/api/config")
-def get_config():
-    """Get current config (return values, mask secrets with indicators)"""
-    return {
+# GET /api/config is served from a cached payload; update_config rebuilds it
+_config_cache: Dict[str, Any] = {"payload": None}
+
+def _build_config_payload() -> Dict[str, Any]:
+    env = os.environ
+    payload = {
         # Non-sensitive values - return actual content
-        "OPENAI_BASE_URL": os.getenv("OPENAI_BASE_URL", ""),
-        "MUJICA_DEFAULT_MODEL": os.getenv("MUJICA_DEFAULT_MODEL", ""),
-        "MUJICA_EMBEDDING_MODEL": os.getenv("MUJICA_EMBEDDING_MODEL", ""),
-        "MUJICA_EMBEDDING_BASE_URL": os.getenv("MUJICA_EMBEDDING_BASE_URL", ""),
-        "OPENREVIEW_USERNAME": os.getenv("OPENREVIEW_USERNAME", ""),
-        
-        # Sensitive values - return actual content (frontend will mask display)
-        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", ""),
-        "MUJICA_EMBEDDING_API_KEY": os.getenv("MUJICA_EMBEDDING_API_KEY", ""),
-        "OPENREVIEW_PASSWORD": os.getenv("OPENREVIEW_PASSWORD", ""),
-        
+        "OPENAI_BASE_URL": env.get("OPENAI_BASE_URL", ""),
+        "MUJICA_DEFAULT_MODEL": env.get("MUJICA_DEFAULT_MODEL", ""),
+        "MUJICA_EMBEDDING_MODEL": env.get("MUJICA_EMBEDDING_MODEL", ""),
+        "MUJICA_EMBEDDING_BASE_URL": env.get("MUJICA_EMBEDDING_BASE_URL", ""),
+        "OPENREVIEW_USERNAME": env.get("OPENREVIEW_USERNAME", ""),
+
         # Advanced settings
-        "MUJICA_FAKE_EMBEDDINGS": os.getenv("MUJICA_FAKE_EMBEDDINGS", "0"),
-        "MUJICA_DISABLE_JSON_MODE": os.getenv("MUJICA_DISABLE_JSON_MODE", "0"),
-        
+        "MUJICA_FAKE_EMBEDDINGS": env.get("MUJICA_FAKE_EMBEDDINGS", "0"),
+        "MUJICA_DISABLE_JSON_MODE": env.get("MUJICA_DISABLE_JSON_MODE", "0"),
+
         # Status flags for UI hints
-        "OPENAI_API_KEY_SET": bool(os.getenv("OPENAI_API_KEY")),
-        "MUJICA_EMBEDDING_API_KEY_SET": bool(os.getenv("MUJICA_EMBEDDING_API_KEY")),
-        "OPENREVIEW_CREDENTIALS_SET": bool(os.getenv("OPENREVIEW_USERNAME") and os.getenv("OPENREVIEW_PASSWORD"))
+        "OPENAI_API_KEY_SET": bool(env.get("OPENAI_API_KEY")),
+        "MUJICA_EMBEDDING_API_KEY_SET": bool(env.get("MUJICA_EMBEDDING_API_KEY")),
+        "OPENREVIEW_CREDENTIALS_SET": bool(env.get("OPENREVIEW_USERNAME") and env.get("OPENREVIEW_PASSWORD")),
     }
+    # Sensitive values - never returned (see the *_SET flags above)
+    for k in _SECRET_KEYS:
+        payload[k] = ""
+    return payload
+
+@app.get("/api/config")
+async def get_config():
+    """Get current config (return values, mask secrets with indicators)"""
+    if _config_cache["payload"] is None:
+        _config_cache["payload"] = _build_config_payload()
+    return _config_cache["payload"]
 
 @app.post("/api/config")
 def update_config(conf: Dict[str, Any]):
     """Update environment variables"""
-    # 1. Update os.environ
-    for k, v in conf.items():
-        if v is not None and v != '':
-            os.environ[k] = str(v)
-            
-    # 2. Persist to .env (filter out None/empty values)
-    to_save = {k: str(v) for k, v in conf.items() if v is not None and v != ''}
+    # Skip empty values and masked secrets
+    to_save = {
+        k: str(v)
+        for k, v in conf.items()
+        if v is not None and v != '' and not (k in _SECRET_KEYS and _unmask(str(v)) is None)
+    }
+
+    # Persist to .env (also updates os.environ)
     if to_save:
         _update_env_file(to_save)
+
+    _config_cache["payload"] = _build_config_payload()
     return {"status": "updated"}
 
 @app.get("/api/history")
-def get_history_list():
+async def get_history_list():
     """List chat history"""
     return {"conversations": list_conversations()}
 
 @app.get("/api/history/{cid}")
-def get_history_detail(cid: str):
+async def get_history_detail(cid: str):
     """Load chat history"""
-    data = load_conversation(cid)
+    # Conversation files can hold full reports; read them off the event loop
+    data = await asyncio.to_thread(load_conversation, cid)
     if not data:
         raise HTTPException(404, "Conversation not found")
     return data
 
 @app.delete("/api/history/{cid}")
-def del_history(cid: str):
-    delete_conversation(cid)
+async def del_history(cid: str):
+    await asyncio.to_thread(delete_conversation, cid)
     return {"status": "deleted"}
 
 @app.post("/api/history/{cid}/rename")
-def rename_history_endpoint(cid: str, data: Dict[str, str]):
+async def rename_history_endpoint(cid: str, data: Dict[str, str]):
     new_title = data.get("title")
     if not new_title:
         raise HTTPException(400, "New title required")
-    res = rename_conversation(cid, new_title)
+    res = await asyncio.to_thread(rename_conversation, cid, new_title)
+    if isinstance(res, dict) and res.get("error") == "not found":
+        raise HTTPException(404, "Conversation not found")
     if isinstance(res, dict) and not res.get("ok"):
          raise HTTPException(500, f"Rename failed: {res.get('error')}")
     return {"status": "ok"}
 
-@app.post("/api/open-pdf")
-def open_pdf_endpoint(data: Dict[str, str]):
-    path = data.get("path")
-    if not path:
-        raise HTTPException(400, "Path required")
-    
-    # Security check: ensure path is within allowed directories or just exists
-    p = Path(path)
-    if not p.exists():
-        raise HTTPException(404, "File not found")
-        
-    try:
-        if platform.system() == 'Windows':
-            os.startfile(str(p))
-        elif platform.system() == 'Darwin':
-            subprocess.call(('open', str(p)))
-        else:
-            subprocess.call(('xdg-open', str(p)))
-        return {"status": "opened"}
-    except Exception as e:
-        print(f"Failed to open PDF: {e}")
-        raise HTTPException(500, f"Failed to open file: {e}")
-
 # ---------------------------
 # PDF Viewer API
 # ---------------------------
+def _open_in_system_app(path: str) -> None:
+    """Hand a file/folder to the OS default handler without waiting for it.
+
+    open/xdg-open can take a while to resolve the handler; Popen returns as soon as the
+    launcher is spawned so the worker thread isn't held. os.startfile is already async.
+    """
+    if sys.platform == "win32":
+        os.startfile(path)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    subprocess.Popen(
+        [opener, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True,
+    )
+
 @app.post("/api/open-pdf")
 def open_pdf(data: Dict[str, str]):
     """Open PDF file in system default viewer"""
-    import subprocess
-    import os
-    
     pdf_path = data.get("pdf_path", "")
     if not pdf_path:
         raise HTTPException(400, "pdf_path is required")
@@ -809,15 +1016,7 @@ def open_pdf(data: Dict[str, str]):
         raise HTTPException(404, f"PDF not found: {pdf_path}")
     
     try:
-        # Windows
-        if sys.platform == "win32":
-            os.startfile(pdf_path)
-        # macOS
-        elif sys.platform == "darwin":
-            subprocess.run(["open", pdf_path], check=True)
-        # Linux
-        else:
-            subprocess.run(["xdg-open", pdf_path], check=True)
+        _open_in_system_app(pdf_path)
         return {"status": "ok", "path": pdf_path}
     except Exception as e:
         raise HTTPException(500, f"Failed to open PDF: {e}")
@@ -830,12 +1029,7 @@ def open_folder(path_data: dict):
         raise HTTPException(404, "Path not found")
     
     try:
-        if os.name == 'nt': # Windows
-            os.startfile(path)
-        elif sys.platform == 'darwin': # macOS
-            subprocess.run(["open", path], check=True)
-        else: # Linux
-            subprocess.run(["xdg-open", path], check=True)
+        _open_in_system_app(path)
         return {"status": "ok"}
     except Exception as e:
         raise HTTPException(500, f"Failed to open folder: {e}")
@@ -844,12 +1038,113 @@ def open_folder(path_data: dict):
 # KB Import / Export API
 # ---------------------------
 
+class _ZipChunkWriter:
+    """Write-only, unseekable file object: ZipFile appends here and the export generator drains it.
+
+    Pieces are kept as written rather than concatenated: with ZIP_STORED the file data reaches
+    write() as the very bytes object read from disk, so it is passed to the response uncopied.
+    """
+
+    def __init__(self):
+        self._pieces: List[bytes] = []
+
+    def write(self, b) -> int:
+        if b:
+            # zipfile may hand over a bytearray/memoryview it reuses; only bytes are safe to keep
+            self._pieces.append(b if isinstance(b, bytes) else bytes(b))
+        return len(b)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> List[bytes]:
+        out, self._pieces = self._pieces, []
+        return out
+
+def _iter_kb_export_files(kb_path: Path):
+    """Yield (file_path, arcname) for everything that goes into a KB backup."""
+    sqlite_path = kb_path / "metadata.sqlite"
+    if sqlite_path.exists():
+        # The DB runs in WAL mode, so recent commits may still live in metadata.sqlite-wal.
+        # Archive a consistent snapshot taken with the backup API instead of the raw file.
+        fd, snap_name = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+        snap_path = Path(snap_name)
+        try:
+            src = sqlite3.connect(str(sqlite_path))
+            dst = sqlite3.connect(snap_name)
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+                src.close()
+            yield snap_path, "metadata.sqlite"
+        finally:
+            snap_path.unlink(missing_ok=True)
+    for db_name in ["papers.lance", "chunks.lance"]:
+        db_path = kb_path / db_name
+        if db_path.exists():
+            for root, dirs, files in os.walk(db_path):
+                for file in files:
+                    file_path = Path(root) / file
+                    yield file_path, str(file_path.relative_to(kb_path))
+
+# Lance fragments are already dense binary; DEFLATE would burn CPU for next to no saving.
+# Set per entry too: ZipInfo objects passed to zf.open() don't inherit the archive's setting.
+_KB_ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+def _kb_zip_info(file_path: Path, arcname: str) -> zipfile.ZipInfo:
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname=arcname)
+    zinfo.compress_type = _KB_ZIP_COMPRESSION
+    return zinfo
+
+def _iter_file_chunks(file_path: Path, chunk_size: int = 1024 * 1024):
+    """Yield a file in chunk_size reads straight from the fd (unbuffered: no 8 KiB BufferedReader hop)."""
+    with open(file_path, "rb", buffering=0) as src:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def _zip_add_file(zf: zipfile.ZipFile, file_path: Path, arcname: str) -> None:
+    """Like zf.write(), but copies in 1 MiB reads instead of zipfile's 8 KiB ones."""
+    zinfo = _kb_zip_info(file_path, arcname)
+    with zf.open(zinfo, "w") as dst:
+        for chunk in _iter_file_chunks(file_path):
+            dst.write(chunk)
+
+def _stream_kb_zip(kb_path: Path):
+    """Build the backup zip on the fly, yielding bytes as they are produced (no temp file)."""
+    writer = _ZipChunkWriter()
+    with zipfile.ZipFile(writer, mode="w", compression=_KB_ZIP_COMPRESSION) as zf:
+        for file_path, arcname in _iter_kb_export_files(kb_path):
+            zinfo = _kb_zip_info(file_path, arcname)
+            with zf.open(zinfo, "w") as dst:
+                for chunk in _iter_file_chunks(file_path):
+                    dst.write(chunk)
+                    yield from writer.drain()
+            yield from writer.drain()
+    # Central directory is written on close
+    yield from writer.drain()
+
+def _ndjson_line(obj: Dict[str, Any]) -> bytes:
+    """One NDJSON progress line, encoded straight to bytes (orjson when available)."""
+    if orjson:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
 def calculate_dir_size(path):
+    """Total size of regular files under path (scandir: one stat per file, no path joins)."""
     total_size = 0
-    for root, dirs, files in os.walk(path):
-        for f in files:
-            fp = os.path.join(root, f)
-            total_size += os.path.getsize(fp)
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
     return total_size
 
 @app.get("/api/kb/export_local")
@@ -865,126 +1160,72 @@ async def export_kb_local():
     filename = f"mujica_kb_backup_{timestamp}.zip"
     target_path = os.path.join(backup_dir, filename)
     
-    kb_path = DATA_DIR / "lancedb"
+    kb_path = KB_DIR
     if not kb_path.exists():
         raise HTTPException(404, "KB not found")
         
-    async def generate():
-        total_size = calculate_dir_size(kb_path)
+    def generate():
+        # Sync generator: Starlette iterates it in a worker thread, so the directory walk
+        # and archive writes don't block the event loop.
+        total_size = calculate_dir_size(kb_path) or 1
         processed_size = 0
+        last_progress = -1
         
         # Initial yield
-        yield json.dumps({"progress": 0, "status": "Starting..."}) + "\n"
+        yield _ndjson_line({"progress": 0, "status": "Starting..."})
         
         try:
-            with zipfile.ZipFile(target_path, "w", compression=zipfile.ZIP_STORED) as zf:
-                # 1. Metadata
-                sqlite_path = kb_path / "metadata.sqlite"
-                if sqlite_path.exists():
-                    zf.write(sqlite_path, arcname="metadata.sqlite")
-                    processed_size += sqlite_path.stat().st_size
-                    yield json.dumps({"progress": int(processed_size / total_size * 100), "status": "Archiving metadata..."}) + "\n"
-                
-                # 2. LanceDB
-                for db_name in ["papers.lance", "chunks.lance"]:
-                    db_path = kb_path / db_name
-                    if db_path.exists():
-                        for root, dirs, files in os.walk(db_path):
-                            for file in files:
-                                file_path = Path(root) / file
-                                rel_path = file_path.relative_to(kb_path)
-                                zf.write(file_path, arcname=str(rel_path))
-                                
-                                processed_size += file_path.stat().st_size
-                                # Yield every 1% or 10MB to avoid spamming
-                                # But for smooth bar, every file is okay if small
-                                yield json.dumps({
-                                    "progress": min(99, int(processed_size / total_size * 100)),
-                                    "status": f"Archiving {rel_path}"
-                                }) + "\n"
+            with zipfile.ZipFile(target_path, "w", compression=_KB_ZIP_COMPRESSION) as zf:
+                for file_path, arcname in _iter_kb_export_files(kb_path):
+                    _zip_add_file(zf, file_path, arcname)
+                    processed_size += file_path.stat().st_size
+                    progress = min(99, int(processed_size / total_size * 100))
+                    # One line per percent step is enough for the progress bar; thousands of
+                    # small Lance fragments would otherwise mean thousands of lines
+                    if progress != last_progress:
+                        last_progress = progress
+                        yield _ndjson_line({"progress": progress, "status": f"Archiving {arcname}"})
             
             # Done
-            yield json.dumps({"progress": 100, "status": "Done", "path": target_path, "dir": backup_dir}) + "\n"
+            yield _ndjson_line({"progress": 100, "status": "Done", "path": target_path, "dir": backup_dir})
             
         except Exception as e:
-            yield json.dumps({"error": str(e)}) + "\n"
+            yield _ndjson_line({"error": str(e)})
 
     return StreamingResponse(generate(), media_type="application/x-ndjson")
 @app.get("/api/kb/export")
-def export_kb(background_tasks: BackgroundTasks):
+def export_kb():
     """Export Knowledge Base (SQLite + LanceDB) as ZIP"""
-    print(f"[KB Export] Request received, starting export process...")
-    print(f"[KB Export] Strategy: Disk-based buffer (NamedTemporaryFile) with ZIP_STORED")
+    print(f"[KB Export] Request received, streaming zip (ZIP_STORED)...")
     
-    kb_path = DATA_DIR / "lancedb"
+    kb_path = KB_DIR
     if not kb_path.exists():
         raise HTTPException(404, "Knowledge base data not found")
-    
-    # Create a temp file on disk, NOT in memory
-    # delete=False because we need to re-open it for streaming
-    # We use a try-finally block for safety only if writing fails, but for streaming we need it to persist
-    
-    tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
-    tmp_file.close() # Close immediately, we just wanted a name
-    temp_path = Path(tmp_file.name)
-        
-    try:
-        # Write to disk
-        print(f"[KB Export] Writing zip to temp file: {temp_path}")
-        with zipfile.ZipFile(temp_path, mode="w", compression=zipfile.ZIP_STORED) as zf:
-            # 1. Archive metadata.sqlite
-            sqlite_path = kb_path / "metadata.sqlite"
-            if sqlite_path.exists():
-                zf.write(sqlite_path, arcname="metadata.sqlite")
-            
-            # 2. Archive LanceDB tables
-            for db_name in ["papers.lance", "chunks.lance"]:
-                db_path = kb_path / db_name
-                if db_path.exists():
-                    for root, dirs, files in os.walk(db_path):
-                        for file in files:
-                            file_path = Path(root) / file
-                            rel_path = file_path.relative_to(kb_path)
-                            zf.write(file_path, arcname=str(rel_path))
-        
-        file_size = temp_path.stat().st_size
-        
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"mujica_kb_backup_{timestamp}.zip"
-        
-        print(f"[KB Export] ZIP created on disk successfully")
-        print(f"[KB Export] File size: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)")
-        print(f"[KB Export] Sending stream...")
 
-        # Schedule cleanup
-        background_tasks.add_task(os.remove, temp_path)
-        
-        return StreamingResponse(
-            open(temp_path, "rb"),
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(file_size)
-            }
-        )
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"mujica_kb_backup_{timestamp}.zip"
 
-    except Exception as e:
-        print(f"[KB Export] Error during export: {e}")
-        if temp_path.exists():
-            os.remove(temp_path)
-        raise HTTPException(500, f"Export failed: {e}")
+    # A sync generator: Starlette iterates it in a worker thread, so file reads stay off the loop
+    return StreamingResponse(
+        _stream_kb_zip(kb_path),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 @app.post("/api/kb/import")
-def import_kb(file: UploadFile = File(...)):
+async def import_kb(file: UploadFile = File(...)):
     """Import and Merge Knowledge Base from ZIP"""
-    import traceback
     
     if not file.filename.endswith(".zip"):
         raise HTTPException(400, "Only .zip files are supported")
     
+    # Extraction, the SQLite merge and the LanceDB appends are all blocking; run them on the
+    # KB I/O pool like the other KB endpoints rather than on the event loop or Starlette's pool
+    return await run_kb_io(_import_kb_sync, file)
+
+def _import_kb_sync(file: UploadFile):
     try:
-        kb_path = DATA_DIR / "lancedb"
-        kb_path.mkdir(parents=True, exist_ok=True)
+        kb_path = KB_DIR
         print(f"[Import] kb_path: {kb_path}")
         
         # Use tempfile for extraction - ALL operations must be inside this block
@@ -994,8 +1235,9 @@ def import_kb(file: UploadFile = File(...)):
             
             # Save uploaded file
             print(f"[Import] Saving upload to: {zip_path}")
-            with open(zip_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
+            # 1 MiB copies: KB backups run to hundreds of MB, the 64 KiB default means many small writes
+            with open(zip_path, "wb", buffering=1024 * 1024) as f:
+                shutil.copyfileobj(file.file, f, 1024 * 1024)
             
             # Create extraction directory
             extract_dir = tmp_path / "extracted"
@@ -1024,130 +1266,164 @@ def import_kb(file: UploadFile = File(...)):
                     _merge_sqlite(str(src_sqlite), str(dst_sqlite))
             
             # 3. Merge LanceDB (vectors) - Add/Append, not overwrite
-            if lancedb:
-                for table_name in ["papers", "chunks"]:
-                    src_tbl_dir = extract_dir / f"{table_name}.lance"
-                    dst_tbl_dir = kb_path / f"{table_name}.lance"
-                    
-                    if src_tbl_dir.exists() and src_tbl_dir.is_dir():
-                        print(f"[Import] Processing LanceDB table: {table_name}")
-                        try:
-                            if not dst_tbl_dir.exists():
-                                # Direct copy if destination doesn't exist
-                                print(f"[Import] Copying new table: {table_name}")
-                                shutil.copytree(src_tbl_dir, dst_tbl_dir)
-                            else:
-                                # Append/merge data into existing table
-                                print(f"[Import] Merging into existing table: {table_name}")
-                                src_db = lancedb.connect(str(extract_dir))
-                                dst_db = lancedb.connect(str(kb_path))
+            chunks_merged = False
+            for table_name in ["papers", "chunks"]:
+                src_tbl_dir = extract_dir / f"{table_name}.lance"
+                dst_tbl_dir = kb_path / f"{table_name}.lance"
+                
+                if src_tbl_dir.exists() and src_tbl_dir.is_dir():
+                    print(f"[Import] Processing LanceDB table: {table_name}")
+                    try:
+                        if not dst_tbl_dir.exists():
+                            # Direct copy if destination doesn't exist
+                            print(f"[Import] Copying new table: {table_name}")
+                            shutil.copytree(src_tbl_dir, dst_tbl_dir)
+                        else:
+                            # Append/merge data into existing table
+                            print(f"[Import] Merging into existing table: {table_name}")
+                            src_db = lancedb.connect(str(extract_dir))
+                            dst_db = lancedb.connect(str(kb_path))
+                            
+                            if table_name in src_db.table_names() and table_name in dst_db.table_names():
+                                src_tbl = src_db.open_table(table_name)
+                                dst_tbl = dst_db.open_table(table_name)
+                                
+                                # Get total count for progress
+                                total_rows = src_tbl.count_rows()
+                                print(f"[Import] Source has {total_rows} rows in {table_name}")
+                                
+                                # Hand the whole Arrow batch stream to a single add(): one scan, no
+                                # pandas frames, and one new table version instead of one per batch
+                                dst_tbl.add(src_tbl.search().limit(None).to_batches(batch_size=10000))
+                                if table_name == "chunks":
+                                    chunks_merged = True
                                 
-                                if table_name in src_db.table_names() and table_name in dst_db.table_names():
-                                    src_tbl = src_db.open_table(table_name)
-                                    dst_tbl = dst_db.open_table(table_name)
-                                    
-                                    # Get total count for progress
-                                    total_rows = src_tbl.count_rows()
-                                    print(f"[Import] Source has {total_rows} rows in {table_name}")
-                                    
-                                    # Batch process to avoid memory issues
-                                    batch_size = 10000
-                                    offset = 0
-                                    total_added = 0
-                                    
-                                    while offset < total_rows:
-                                        # Use LanceDB's search with limit/offset for batching
-                                        batch_df = src_tbl.to_pandas()[offset:offset + batch_size]
-                                        if batch_df.empty:
-                                            break
-                                        
-                                        batch_data = batch_df.to_dict('records')
-                                        if batch_data:
-                                            dst_tbl.add(batch_data)
-                                            total_added += len(batch_data)
-                                            print(f"[Import] Added {total_added}/{total_rows} records to {table_name}")
-                                        
-                                        offset += batch_size
-                                    
-                                    print(f"[Import] Completed merging {total_added} records into {table_name}")
-                        except Exception as e:
-                            print(f"[Import] LanceDB error for {table_name} (non-fatal): {e}")
-                            traceback.print_exc()
+                                print(f"[Import] Completed merging {total_rows} records into {table_name}")
+                    except Exception as e:
+                        print(f"[Import] LanceDB error for {table_name} (non-fatal): {e}")
+                        traceback.print_exc()
             
+            if chunks_merged:
+                # Appended chunks sit outside the IVF index; fold them in once for the whole import
+                refresh_kb().ensure_chunk_index()
+            _invalidate_stats_cache()
             # Return success - this is inside the with block
             return {"status": "ok", "message": "Import and merge completed"}
     
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         print(f"[Import] Fatal error: {e}")
         traceback.print_exc()
         raise HTTPException(500, f"Import failed: {str(e)}")
 
 def _merge_sqlite(src_path: str, dst_path: str):
-    """Helper to merge SQLite databases using INSERT OR IGNORE"""
+    """Merge src into dst with per-table INSERT OR IGNORE ... SELECT over an ATTACHed src"""
     print(f"[SQLite Merge] Starting: {src_path} -> {dst_path}")
     
-    conn_src = sqlite3.connect(src_path)
     conn_dst = sqlite3.connect(dst_path)
-    conn_dst.row_factory = sqlite3.Row
     
     try:
-        # Get all tables from source
-        cursor_src = conn_src.cursor()
-        cursor_src.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-        tables_info = cursor_src.fetchall()
+        # Attach the source so every copy runs as INSERT ... SELECT inside SQLite,
+        # with no per-row trip through Python
+        conn_dst.execute("ATTACH DATABASE ? AS src", (src_path,))
+        # Bulk-load settings for this connection only. The destination stays in WAL (the
+        # live KB connection has it open, so journal_mode can't change under it); with
+        # synchronous=OFF the single commit below skips its fsync.
+        conn_dst.execute("PRAGMA synchronous=OFF")
+        conn_dst.execute("PRAGMA temp_store=MEMORY")
+        conn_dst.execute("PRAGMA cache_size=-200000")
+        tables_info = conn_dst.execute(
+            "SELECT name, sql FROM src.sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
         
         print(f"[SQLite Merge] Found {len(tables_info)} tables in source")
+
+        # One write transaction for the whole merge: all tables land together or not at all
+        conn_dst.execute("BEGIN IMMEDIATE")
+
+        # FTS virtual tables and their shadow tables are maintained by triggers on the
+        # destination; copying them row by row would corrupt the index.
+        virtual = [n for n, sql in tables_info if (sql or "").upper().startswith("CREATE VIRTUAL TABLE")]
         
         for table_name, create_sql in tables_info:
+            if any(table_name == v or table_name.startswith(v + "_") for v in virtual):
+                print(f"[SQLite Merge] Skipping FTS table: {table_name}")
+                continue
             print(f"[SQLite Merge] Processing table: {table_name}")
             
             # Check if table exists in destination
-            cursor_dst = conn_dst.cursor()
-            cursor_dst.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-            
-            if not cursor_dst.fetchone():
+            if not conn_dst.execute(
+                "SELECT 1 FROM main.sqlite_master WHERE type='table' AND name=?", (table_name,)
+            ).fetchone():
                 # Table doesn't exist - create it using the same schema
                 print(f"[SQLite Merge] Creating table {table_name} in destination")
                 conn_dst.execute(create_sql)
-                conn_dst.commit()
-            
-            # Read data from source
-            cursor_src.execute(f"SELECT * FROM {table_name}")
-            columns = [desc[0] for desc in cursor_src.description]
             
-            # Batch insert for large tables
-            batch_size = 1000
-            total_inserted = 0
+            # Copy by column name: a backup from an older build may lack migrated columns
+            # (or have them in another order), so SELECT * would misalign
+            src_cols = [r[1] for r in conn_dst.execute(f'PRAGMA src.table_info("{table_name}")')]
+            dst_cols = {r[1] for r in conn_dst.execute(f'PRAGMA main.table_info("{table_name}")')}
+            cols = ", ".join(f'"{c}"' for c in src_cols if c in dst_cols)
+            if not cols:
+                continue
             
-            while True:
-                rows = cursor_src.fetchmany(batch_size)
-                if not rows:
-                    break
-                
-                placeholders = ",".join(["?"] * len(columns))
-                col_names = ",".join(columns)
-                sql = f"INSERT OR IGNORE INTO {table_name} ({col_names}) VALUES ({placeholders})"
-                
-                conn_dst.executemany(sql, rows)
-                conn_dst.commit()
-                total_inserted += len(rows)
+            cur = conn_dst.execute(
+                f'INSERT OR IGNORE INTO main."{table_name}" ({cols}) SELECT {cols} FROM src."{table_name}"'
+            )
             
-            print(f"[SQLite Merge] Inserted {total_inserted} rows into {table_name}")
+            print(f"[SQLite Merge] Inserted {cur.rowcount} rows into {table_name}")
         
+        conn_dst.commit()
         print(f"[SQLite Merge] Completed successfully")
         
     except Exception as e:
+        conn_dst.rollback()
         print(f"[SQLite Merge] Error: {e}")
-        import traceback
         traceback.print_exc()
         raise
     finally:
-        conn_src.close()
         conn_dst.close()
 
 if __name__ == "__main__":
+    import multiprocessing
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # PDF parsing uses a process pool; frozen (PyInstaller) children re-run this entry point.
+    multiprocessing.freeze_support()
+
+    # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build,
+    # so fall back to the stock asyncio loop / h11 parser when unavailable.
+    loop_impl = "asyncio"
+    if sys.platform != "win32":
+        try:
+            import uvloop  # noqa: F401
+            loop_impl = "uvloop"
+        except ImportError:
+            pass
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+
+    try:
+        workers = max(1, int(os.getenv("MUJICA_WORKERS", "1") or 1))
+    except ValueError:
+        workers = 1
+
+    # Multi-worker mode needs an import string so each worker can re-import the app.
+    # A PyInstaller bundle cannot be re-imported that way, so it always runs one process.
+    # NOTE: job state lives in-process, so job polling assumes a single worker.
+    if workers > 1 and not IS_PACKAGED:
+        uvicorn.run(
+            "app:app",
+            app_dir=str(Path(__file__).resolve().parent),
+            host="0.0.0.0",
+            port=8000,
+            loop=loop_impl,
+            http=http_impl,
+            workers=workers,
+        )
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop_impl, http=http_impl)
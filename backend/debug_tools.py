@@ -1,12 +1,21 @@
-import traceback
-import sys
-import datetime
+import logging
+from logging.handlers import RotatingFileHandler
+
+# One persistent handle for the debug log instead of open/append/close per line.
+# delay=True: the file is only created once something is actually logged.
+_logger = logging.getLogger("mujica.debug")
+_logger.setLevel(logging.DEBUG)
+_logger.propagate = False
+if not _logger.handlers:
+    _handler = RotatingFileHandler(
+        "backend_debug_log.txt", maxBytes=10_000_000, backupCount=3, encoding="utf-8", delay=True
+    )
+    _handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    _logger.addHandler(_handler)
 
 def log_debug(msg):
-    with open("backend_debug_log.txt", "a", encoding="utf-8") as f:
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        f.write(f"[{timestamp}] {msg}\n")
+    _logger.debug(msg)
 
 def log_exception(e, context=""):
-    msg = f"EXCEPTION in {context}: {str(e)}\n{traceback.format_exc()}"
-    log_debug(msg)
+    # exc_info appends the active traceback, same text as traceback.format_exc()
+    _logger.exception(f"EXCEPTION in {context}: {str(e)}")
@@ -5,10 +5,17 @@ import uuid
 import os
 import sys
 from pathlib import Path
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from fastapi.encoders import jsonable_encoder
 
+# orjson round-trips large history snapshots much faster than jsonable_encoder's Python walk
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup sys.path before importing from src
 # This ensures the module can be imported both in dev mode and packaged mode
 IS_PACKAGED = getattr(sys, 'frozen', False)
@@ -50,6 +57,7 @@ def _get_data_dir() -> Path:
 
 DATA_DIR = _get_data_dir()
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+KB_DIR = DATA_DIR / "lancedb"
 
 # ---------------------------
 # Job Classes
@@ -71,21 +79,29 @@ class JobBase:
     started_ts: float = field(default_factory=lambda: time.time())
     finished_ts: Optional[float] = None
     thread: Optional[threading.Thread] = None
+    future: Optional[Future] = None
+    # kind -> monotonic time of the last progress payload stored (see _job_emit_progress)
+    _last_emit_ts: Dict[str, float] = field(default_factory=dict, repr=False)
 
     def to_dict(self):
+        # Snapshot under the lock, build the dict after. progress is copied because the
+        # runner keeps writing into it while the response is being serialized.
         with self.lock:
-            return {
-                "job_id": self.job_id,
-                "type": self.type,
-                "status": self.status,
-                "stage": self.stage,
-                "message": self.message,
-                "progress": self.progress,
-                "result": self.result,
-                "error": self.error,
-                "started_ts": self.started_ts,
-                "finished_ts": self.finished_ts,
-            }
+            status, stage, message = self.status, self.stage, self.message
+            progress = dict(self.progress)
+            result, error, finished_ts = self.result, self.error, self.finished_ts
+        return {
+            "job_id": self.job_id,
+            "type": self.type,
+            "status": status,
+            "stage": stage,
+            "message": message,
+            "progress": progress,
+            "result": result,
+            "error": error,
+            "started_ts": self.started_ts,
+            "finished_ts": finished_ts,
+        }
 
 @dataclass
 class PlanJob(JobBase):
@@ -105,8 +121,22 @@ class IngestJob(JobBase):
 
 class JobManager:
     def __init__(self):
+        # Lookups go straight to the dict (a single dict.get is atomic in CPython); _lock only
+        # guards mutation and whole-dict snapshots. Per-job state is guarded by job.lock.
         self.jobs: Dict[str, JobBase] = {}
         self._lock = threading.Lock()
+        self._complete_hooks: List[Callable[[JobBase], None]] = []
+
+    def on_job_complete(self, hook: Callable[[JobBase], None]) -> None:
+        """Register a callback fired when a job finishes successfully."""
+        self._complete_hooks.append(hook)
+
+    def notify_job_complete(self, job: JobBase) -> None:
+        for hook in list(self._complete_hooks):
+            try:
+                hook(job)
+            except Exception as e:
+                print(f"[JobManager] on_job_complete hook failed: {e}")
 
     def create_job(self, job_type: str) -> JobBase:
         job_id = uuid.uuid4().hex
@@ -124,13 +154,19 @@ class JobManager:
         return job
 
     def get_job(self, job_id: str) -> Optional[JobBase]:
+        return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[JobBase]:
         with self._lock:
-            return self.jobs.get(job_id)
+            return list(self.jobs.values())
 
     def cancel_job(self, job_id: str):
         job = self.get_job(job_id)
         if job:
             job.cancel_event.set()
+            # Drop it from the pool queue if it hasn't started yet
+            if job.future is not None and job.future.cancel():
+                _job_update(job, status="cancelled", stage="cancelled", message="Cancelled", finished_ts=time.time())
             return True
         return False
 
@@ -148,10 +184,30 @@ def _job_update(job: JobBase, **kwargs: Any) -> None:
         # Update timestamp only if significant changes
         job.progress["_ts"] = time.time()
 
-def _job_emit_progress(job: JobBase, *, kind: str, payload: Dict[str, Any]) -> None:
+# The UI polls a few times per second; ingest can report thousands of ticks per second
+_PROGRESS_MIN_INTERVAL = 0.1
+
+def _job_emit_progress(
+    job: JobBase, *, kind: str, payload: Dict[str, Any], message: Optional[str] = None
+) -> bool:
+    """Store a progress payload (and optionally the status message) in one locked step.
+
+    Ticks of the same kind closer than _PROGRESS_MIN_INTERVAL are dropped, except the first one
+    and terminal ones (current == total, which also covers payloads without counters).
+    Returns whether the tick was stored.
+    """
+    now = time.monotonic()
+    terminal = payload.get("current") == payload.get("total")
     with job.lock:
+        last = job._last_emit_ts.get(kind)
+        if last is not None and not terminal and now - last < _PROGRESS_MIN_INTERVAL:
+            return False
+        job._last_emit_ts[kind] = now
         job.progress[kind] = payload
+        if message is not None:
+            job.message = message
         job.progress["_ts"] = time.time()
+    return True
 
 def run_plan_job(
     job: PlanJob,
@@ -195,9 +251,20 @@ def run_plan_job(
         _job_update(job, status="cancelled", stage="cancelled", message="Planning Cancelled", error=str(e), finished_ts=time.time())
     except Exception as e:
         print(f"[JobManager] Error: {e}")
-        import traceback
-        traceback.print_exc()
-        _job_update(job, status="error", stage="error", message="Planning Failed ❌", error=str(e), error_trace=traceback.format_exc(), finished_ts=time.time())
+        # Format once: the same text goes to the console and into the job result
+        tb = traceback.format_exc()
+        print(tb, end="", file=sys.stderr)
+        _job_update(job, status="error", stage="error", message="Planning Failed ❌", error=str(e), error_trace=tb, finished_ts=time.time())
+
+def _to_jsonable(obj: Any) -> Any:
+    """Plain JSON types for persisting; unknown objects become str (orjson) or go through FastAPI's encoder."""
+    if orjson:
+        try:
+            return orjson.loads(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return jsonable_encoder(obj)
+
 
 def run_research_job(
     job: ResearchJob,
@@ -218,7 +285,7 @@ def run_research_job(
             model_name = "deepseek-chat"
 
         kb = KnowledgeBase(
-            db_path=str(DATA_DIR / "lancedb"),
+            db_path=str(KB_DIR),
             embedding_model=embedding_model,
             embedding_api_key=embedding_api_key,
             embedding_base_url=embedding_base_url,
@@ -238,10 +305,10 @@ def run_research_job(
         
         def _on_research_progress(payload: Dict[str, Any]) -> None:
             if not isinstance(payload, dict): return
-            _job_emit_progress(job, kind="research", payload=payload)
-            stg = payload.get("stage")
-            if stg == "research_section":
-                _job_update(job, message=f"Researching: {payload.get('section')}")
+            message = None
+            if payload.get("stage") == "research_section":
+                message = f"Researching: {payload.get('section')}"
+            _job_emit_progress(job, kind="research", payload=payload, message=message)
 
         notes = researcher.execute_research(plan, on_progress=_on_research_progress, cancel_event=job.cancel_event)
         _job_update(job, result={"research_notes": notes})
@@ -251,9 +318,8 @@ def run_research_job(
         
         def _on_write_progress(payload: Dict[str, Any]) -> None:
             if not isinstance(payload, dict): return
-            _job_emit_progress(job, kind="write", payload=payload)
-            if payload.get("stage") == "write_llm_call":
-                _job_update(job, message="Generating content with LLM...")
+            message = "Generating content with LLM..." if payload.get("stage") == "write_llm_call" else None
+            _job_emit_progress(job, kind="write", payload=payload, message=message)
 
         report, ref_ctx = writer.write_report(plan, notes, on_progress=_on_write_progress, cancel_event=job.cancel_event)
         
@@ -290,7 +356,7 @@ def run_research_job(
                      "report_ref_ctx": ref_ctx
                 }
             }
-            save_conversation(job.job_id, jsonable_encoder(snapshot))
+            save_conversation(job.job_id, _to_jsonable(snapshot))
         except Exception as history_error:
             print(f"[JobManager] Failed to save history: {history_error}")
             try:
@@ -325,7 +391,7 @@ def run_ingest_job(
         _job_update(job, status="running", stage="ingest", message="Ingesting Data...")
         
         kb = KnowledgeBase(
-            db_path=str(DATA_DIR / "lancedb"),
+            db_path=str(KB_DIR),
             embedding_model=embedding_model,
             embedding_api_key=embedding_api_key,
             embedding_base_url=embedding_base_url,
@@ -333,8 +399,11 @@ def run_ingest_job(
         kb.initialize_db()
         ingestor = OpenReviewIngestor(kb, fetcher=ConferenceDataFetcher(output_dir=str(DATA_DIR / "raw")))
 
+        # Bound once: the callback runs for every fetched/parsed/embedded item
+        is_cancelled = job.cancel_event.is_set
+
         def _on_progress(payload: Dict[str, Any]) -> None:
-            if job.cancel_event.is_set():
+            if is_cancelled():
                 raise MujicaCancelled("User Cancelled")
             
             stage = payload.get("stage", "unknown")
@@ -350,20 +419,20 @@ def run_ingest_job(
                     "total": tot,
                     "sub_stage": stage,
                     **{k: v for k, v in payload.items() if k not in ("stage", "current", "total")}
-                })
-                _job_update(job, message=f"Embedding {cur}/{tot}")
+                }, message=f"Embedding {cur}/{tot}")
             elif stage == "prepare_chunks":
-                _job_emit_progress(job, kind="chunking", payload=payload)
-                _job_update(job, message=f"Chunking {cur}/{tot}")
+                _job_emit_progress(job, kind="chunking", payload=payload, message=f"Chunking {cur}/{tot}")
             else:
-                _job_emit_progress(job, kind=stage, payload=payload)
                 # Update message based on stage
-                if stage == "fetch_papers":
-                    _job_update(job, message=f"Fetching Meta {cur}/{tot}")
-                elif stage == "download_pdf":
-                    _job_update(job, message=f"Downloading PDF {cur}/{tot}")
-                elif stage == "parse_pdf":
-                    _job_update(job, message=f"Parsing PDF {cur}/{tot}")
+                message = {
+                    "fetch_papers": "Fetching Meta",
+                    "download_pdf": "Downloading PDF",
+                    "parse_pdf": "Parsing PDF",
+                }.get(stage)
+                _job_emit_progress(
+                    job, kind=stage, payload=payload,
+                    message=f"{message} {cur}/{tot}" if message else None,
+                )
 
         papers = ingestor.ingest_venue(
             venue_id=venue_id,
@@ -379,6 +448,7 @@ def run_ingest_job(
         )
 
         _job_update(job, status="done", stage="done", message=f"Ingest Complete: {len(papers)} papers", result=papers, finished_ts=time.time())
+        manager.notify_job_complete(job)
     except MujicaCancelled as e:
         _job_update(job, status="cancelled", stage="cancelled", message="Ingest Cancelled", error=str(e), finished_ts=time.time())
     except Exception as e:
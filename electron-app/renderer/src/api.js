@@ -6,7 +6,6 @@ export const api = {
     health: () => axios.get('http://127.0.0.1:8000/'),
     listJobs: () => axios.get(`${API_BASE}/jobs`),
     getJob: (jobId) => axios.get(`${API_BASE}/jobs/${jobId}`),
-    cancelJob: (jobId) => axios.delete(`${API_BASE}/jobs/${jobId}`),
 
     startPlan: (query, options = {}) => axios.post(`${API_BASE}/plan`, { query, ...options }),
     startResearch: (plan, options = {}) => axios.post(`${API_BASE}/research`, { plan, ...options }),
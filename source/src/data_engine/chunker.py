@@ -1,6 +1,21 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List
+
+# encoding_name -> tiktoken Encoding；加载失败（未安装 / 离线拿不到 BPE 文件）记为 None，
+# 之后直接走字符切分，不再每个 chunk 都重试 import / 下载
+_ENC_CACHE: Dict[str, Any] = {}
+
+
+def _get_encoding(encoding_name: str) -> Any:
+    if encoding_name not in _ENC_CACHE:
+        try:
+            import tiktoken
+
+            _ENC_CACHE[encoding_name] = tiktoken.get_encoding(encoding_name)
+        except Exception:
+            _ENC_CACHE[encoding_name] = None
+    return _ENC_CACHE[encoding_name]
 
 
 def chunk_text(
@@ -25,25 +40,20 @@ def chunk_text(
     if overlap_tokens >= max_tokens:
         overlap_tokens = max_tokens // 5
 
+    enc = _get_encoding(encoding_name)
     try:
-        import tiktoken
-
-        enc = tiktoken.get_encoding(encoding_name)
+        if enc is None:
+            raise RuntimeError("tiktoken unavailable")
         tokens = enc.encode(text)
         if len(tokens) <= max_tokens:
             return [text]
 
-        chunks: List[str] = []
-        start = 0
-        while start < len(tokens):
-            end = min(start + max_tokens, len(tokens))
-            chunk = enc.decode(tokens[start:end]).strip()
-            if chunk:
-                chunks.append(chunk)
-            if end >= len(tokens):
-                break
-            start = max(0, end - overlap_tokens)
-        return chunks
+        # 窗口起点一次算好：步长 max-overlap；起点 < len-overlap 保证最后一个窗口恰好覆盖到结尾
+        # （不用 decode_batch：它每次调用都新建线程池，对几十个小窗口反而更慢）
+        step = max_tokens - overlap_tokens
+        starts = range(0, len(tokens) - overlap_tokens, step)
+        decoded = (enc.decode(tokens[s : s + max_tokens]).strip() for s in starts)
+        return [c for c in decoded if c]
     except Exception:
         # fallback：按字符切（粗糙但可用）
         approx_chars = max_tokens * 4  # 粗略估计 1 token ≈ 3~4 chars
@@ -51,16 +61,8 @@ def chunk_text(
         if len(text) <= approx_chars:
             return [text]
 
-        chunks: List[str] = []
-        start = 0
-        while start < len(text):
-            end = min(start + approx_chars, len(text))
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
-            if end >= len(text):
-                break
-            start = max(0, end - overlap_chars)
-        return chunks
+        # 与 token 路径同样的窗口划分
+        starts = range(0, len(text) - overlap_chars, approx_chars - overlap_chars)
+        return [c for c in (text[s : s + approx_chars].strip() for s in starts) if c]
 
 
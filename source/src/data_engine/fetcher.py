@@ -1,14 +1,251 @@
 import openreview
+import itertools
+import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
+import shutil
 import time
 import re
 import random
-from typing import List, Dict, Optional, Set
+from typing import Iterable, List, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+# orjson 解析 OpenReview 的大 JSON 响应（一页 200 篇 + replies 可达数十 MB）；未安装时走 SDK 自带的 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PDF 下载并发上限；共享 Session 的连接池按它开，保证每个下载线程都能拿到常驻的 keep-alive 连接
+_PDF_DOWNLOAD_MAX_WORKERS = 16
+
+# 下载重试退避的下限/上限（秒），见 _backoff_delay
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+
+# 评分/置信度里的首个数字（"8: Accept" -> 8），每条 review 调用两次，预编译
+_NUM_RE = re.compile(r"(-?\d+(?:\.\d+)?)")
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+
+# 表示“这是一条打分评审”的 content 字段（不同会议表单命名不同）
+_RATING_KEYS = frozenset({"rating", "recommendation", "overall_rating", "score"})
+# 拼 review 正文时不作为“额外字段”收录的 key
+_REVIEW_EXTRA_SKIP_KEYS = frozenset({
+    # 打分/决策类
+    "rating",
+    "recommendation",
+    "overall_rating",
+    "score",
+    "confidence",
+    "overall_confidence",
+    "decision",
+    # 作者回应类（放到 paper-level rebuttal_text；不混进 reviewer 文本）
+    "rebuttal",
+    "author_response",
+    "author comment",
+    "author_comment",
+    "response",
+    # 常见短字段
+    "title",
+    # 已单独抽取的正文字段
+    "summary",
+    "strengths",
+    "weaknesses",
+})
+# 需要遍历 submission replies 才能得到的字段
+_REPLY_FIELDS = frozenset({"reviews", "decision", "rebuttal", "presentation"})
+# 拼 rebuttal 正文时跳过的打分/决策类 key
+_REBUTTAL_SKIP_KEYS = frozenset({
+    "rating",
+    "recommendation",
+    "overall_rating",
+    "score",
+    "confidence",
+    "overall_confidence",
+    "decision",
+    "title",
+})
+
+def _val(obj: Dict, key: str, default=None):
+    """OpenReview v2 的 content 字段形如 {"value": ...}；取出 value（兼容 v1 的直接值）。"""
+    if not isinstance(obj, dict):
+        return default
+    v = obj.get(key, default)
+    if isinstance(v, dict) and "value" in v:
+        return v.get("value", default)
+    return v
+
+
+def _cdate(reply: Dict) -> int:
+    """reply 的创建时间（毫秒时间戳）。OpenReview 返回的 cdate/tcdate 本身就是 int，无需再 int() + try。"""
+    return reply.get("cdate") or reply.get("tcdate") or 0
+
+
+def _long_text_fields(content: Dict):
+    """按表单顺序逐个产出 review 里较长的额外文本字段 (key, text)。"""
+    for k in content or {}:
+        if k in _REVIEW_EXTRA_SKIP_KEYS:
+            continue
+        vv = _val(content, k, None)
+        if not isinstance(vv, str):
+            continue
+        ss = vv.strip()
+        # 过滤掉空值和过短的 Yes/No/checklist 类内容
+        if len(ss) < 20:
+            continue
+        yield str(k), ss
+
+
+def _retry_after_seconds(resp) -> Optional[float]:
+    """解析响应头 Retry-After：可能是秒数，也可能是 HTTP-date（RFC 7231）。"""
+    try:
+        ra = resp.headers.get("Retry-After")
+    except Exception:
+        return None
+    if not ra:
+        return None
+    ra = str(ra).strip()
+    try:
+        return max(0.0, float(ra))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(ra)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(prev: float, resp=None) -> Optional[float]:
+    """
+    下载失败后的等待秒数（decorrelated jitter）：min(cap, uniform(base, prev * 3))。
+    各线程的重试时间随机错开，不会在同一时刻一起重打、把 429 放大；
+    服务器给了 Retry-After 时至少等那么久（同样不超过 cap）。
+    返回值作为下一次的 prev；返回 None 表示不必再重试（404/401/403）。
+    """
+    sc = getattr(resp, "status_code", None)
+    if sc in {401, 403, 404}:
+        return None
+    wait = min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, max(prev, _BACKOFF_BASE) * 3))
+    if resp is not None:
+        ra = _retry_after_seconds(resp)
+        if ra is not None:
+            wait = max(wait, min(ra, _BACKOFF_CAP))
+    return wait
+
+
+def _parse_presentation(decision: Optional[str]) -> Optional[str]:
+    """
+    从 decision 字符串中提取展示类型（oral/spotlight/poster）。
+    不同会议/年份的 decision 文本格式可能不同，因此做宽松匹配。
+    """
+    if not decision:
+        return None
+    return _presentation_of(str(decision).lower())
+
+
+# 按优先级排列的 (关键词, 展示类型)：
+# 常见形式 Accept (Oral) / Accept (Spotlight) / Accept (Poster)；有的会写 talk；
+# 最后是接收但未标明展示类型
+_PRESENTATION_RULES = (
+    ("oral", "oral"),
+    ("spotlight", "spotlight"),
+    ("poster", "poster"),
+    ("talk", "oral"),
+    ("accept", "unknown"),
+)
+
+
+@lru_cache(maxsize=512)
+def _presentation_of(d: str) -> Optional[str]:
+    # 一个会议的 decision 文本只有寥寥几种，按小写串缓存结果
+    for needle, label in _PRESENTATION_RULES:
+        if needle in d:
+            return label
+    return None
+
+
+class _PdfSniffWriter:
+    """
+    包一层文件对象：写入的同时记下开头 5 字节、末尾 2KB 和总长度，
+    下载完直接据此判断是不是 PDF，不用再把刚写完的文件读回来。
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self.head = b""
+        self.tail = bytearray()
+        self.size = 0
+
+    def write(self, b) -> int:
+        if len(self.head) < 5:
+            self.head += bytes(b[: 5 - len(self.head)])
+        if len(b) >= 2048:
+            self.tail[:] = b[-2048:]
+        else:
+            self.tail += b
+            del self.tail[:-2048]
+        self.size += len(b)
+        return self._f.write(b)
+
+
+class _AdaptiveLimit:
+    """
+    PDF 下载的自适应并发上限（AIMD）：
+    - 遇到 429/503 并发减半（同一波限流在 1 秒内只减一次，避免被并发的多个失败一路砍到 1）
+    - 连续成功 grow_after 次后并发 +1，直到回到 max_limit
+    线程池仍按 max_limit 开线程，超出当前上限的线程在 slot() 里排队，不再一起打向已经在限流的服务器。
+    """
+
+    def __init__(self, max_limit: int, grow_after: int = 8):
+        self.max_limit = max(1, int(max_limit))
+        self.limit = self.max_limit
+        self._grow_after = max(1, int(grow_after))
+        self._in_use = 0
+        self._ok_streak = 0
+        self._last_shrink = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self._in_use >= self.limit:
+                self._cond.wait()
+            self._in_use += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+
+    def shrink(self) -> None:
+        with self._cond:
+            self._ok_streak = 0
+            now = time.monotonic()
+            if now - self._last_shrink < 1.0:
+                return
+            self._last_shrink = now
+            self.limit = max(1, self.limit // 2)
+
+    def success(self) -> None:
+        with self._cond:
+            self._ok_streak += 1
+            if self._ok_streak >= self._grow_after and self.limit < self.max_limit:
+                self._ok_streak = 0
+                self.limit += 1
+                self._cond.notify()
+
+
 class ConferenceDataFetcher:
     """
     从 OpenReview 获取会议论文数据
@@ -19,6 +256,12 @@ class ConferenceDataFetcher:
         self.output_dir = output_dir
         self.client = None
         self.pdf_dir = os.path.join(output_dir, "pdfs")
+        # PDF 下载共用的 HTTP 会话（见 _pdf_session）
+        self._pdf_http: Optional[requests.Session] = None
+        self._pdf_http_lock = threading.Lock()
+        self._pdf_limiter: Optional[_AdaptiveLimit] = None
+        # 已有 PDF 的校验结果缓存（见 _valid_cache_for）
+        self._valid_cache: Optional[Dict] = None
         
         # 创建输出目录
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
@@ -51,9 +294,10 @@ class ConferenceDataFetcher:
         limit: Optional[int] = None,
         *,
         accepted_only: bool = False,
-        skip_paper_ids: Optional[Set[str]] = None,
+        skip_paper_ids: Optional[Iterable[str]] = None,
         on_progress=None,
         content_fields: List[str] = None,
+        need_reviews: bool = True,
     ) -> List[Dict]:
         """
         获取会议的论文列表
@@ -64,6 +308,8 @@ class ConferenceDataFetcher:
             accepted_only: 仅返回决策为 Accept 的论文（含 oral/spotlight/poster 等）
             skip_paper_ids: 跳过已存在的 paper_id（用于“追加抓取”模式）。当传入该参数时，limit 表示“返回的新论文数量上限”。
             content_fields: 需要获取的内容字段列表
+            need_reviews: 是否拉取 replies（评审/决策/rebuttal）。replies 占响应体积的大头，
+                只要元数据时传 False；accepted_only 依赖决策，会强制拉取
         
         Returns:
             论文字典列表，每个字典包含论文的元数据
@@ -73,6 +319,9 @@ class ConferenceDataFetcher:
         
         if content_fields is None:
             content_fields = ['title', 'abstract', 'authors', 'keywords', 'pdf']
+        # 每条 submission 都要查一次：调用方传 list/tuple 时转成 frozenset，避免 O(n) 的 in
+        if skip_paper_ids and not isinstance(skip_paper_ids, (set, frozenset)):
+            skip_paper_ids = frozenset(skip_paper_ids)
         
         papers = []
         
@@ -88,86 +337,157 @@ class ConferenceDataFetcher:
             page_size = int(os.getenv("MUJICA_OPENREVIEW_PAGE_SIZE", "200") or 200)
             page_size = max(20, min(page_size, 1000))
 
-            offset = 0
             total_target = int(limit) if isinstance(limit, int) and limit > 0 else None
             fetched = 0  # 实际加入 papers 的数量（accepted_only 时为“accepted 数量”）
             seen = 0  # 扫描过的 submission 数量
+            # 当启用 accepted_only 或 skip_paper_ids 时，需要“扫描更多 submission 才能凑够目标数量”，不做缩小优化
+            exact = (total_target is not None) and (not accepted_only) and (not skip_paper_ids)
 
-            while True:
-                batch_limit = page_size
-                # 当启用 accepted_only 或 skip_paper_ids 时，需要“扫描更多 submission 才能凑够目标数量”，不做缩小优化
-                if (total_target is not None) and (not accepted_only) and (not skip_paper_ids):
-                    remain = total_target - fetched
-                    if remain <= 0:
-                        break
-                    batch_limit = min(batch_limit, remain)
+            # 同一会议的所有论文年份相同，只解析一次
+            venue_year = self._extract_year_from_venue(venue_id)
 
-                submissions = self.client.get_notes(
+            # OpenReview 没有字段投影参数，能省的只有 replies 这一大块；
+            # content_fields 里点名评审/决策类字段也视为需要 replies
+            need_replies = need_reviews or accepted_only or not _REPLY_FIELDS.isdisjoint(content_fields)
+            details = "replies" if need_replies else None
+
+            # 分页预取：同时保持 K 个 offset 的请求在途，按 offset 顺序消费，
+            # 网络往返彼此重叠（大会议上主要耗时就是等 OpenReview 响应）
+            page_workers = int(os.getenv("MUJICA_OPENREVIEW_PAGE_WORKERS", "4") or 4)
+            page_workers = max(1, min(page_workers, 8))
+
+            # accepted_only：优先让服务端按 venueid 过滤（接收率 ~25% 时少拉约 3/4 的投稿）；
+            # 客户端的 decision 检查保留，语义不变
+            note_filter = self._accepted_filter(submission_invitation, venue_id) if accepted_only else None
+
+            def _fetch_page(page_offset: int, batch_limit: int):
+                return self._get_notes(
                     invitation=submission_invitation,
-                    details="replies",
+                    details=details,
                     limit=batch_limit,
-                    offset=offset,
+                    offset=page_offset,
+                    content=note_filter,
                 )
 
-                if not submissions:
-                    break
+            # 追加抓取模式：从上次记录的游标处继续扫描（见 _resume_offset）
+            cursor_key = f"{venue_id}|accepted_only={int(bool(accepted_only))}" + ("|venueid" if note_filter else "")
+            start_offset, prefix_kb_ids = (
+                self._resume_offset(submission_invitation, cursor_key, note_filter, skip_paper_ids)
+                if skip_paper_ids
+                else (0, [])
+            )
+            if start_offset:
+                print(f"  Resuming scan at offset {start_offset} (earlier submissions already known)")
+            # 游标只越过“开头连续的已知 submission”：已入库的，或 accepted_only 下已有非接收决策的；
+            # 其中已入库的 id 记进 prefix_kb_ids，下次续扫前核对它们仍都在库里
+            known_prefix_end, known_prefix_id, prefix_open = start_offset, None, bool(skip_paper_ids)
 
-                for submission in submissions:
-                    seen += 1
-                    paper_data = self._extract_paper_info(submission, content_fields, venue_id=venue_id)
+            in_flight: Dict[int, tuple] = {}  # offset -> (future, batch_limit)
+            next_offset = start_offset
 
-                    if accepted_only:
-                        decision = paper_data.get("decision")
-                        d = str(decision or "").lower()
-                        if "accept" not in d:
-                            continue
+            def _submit_next() -> bool:
+                nonlocal next_offset
+                batch_limit = page_size
+                if exact:
+                    batch_limit = min(batch_limit, total_target - next_offset)
+                    if batch_limit <= 0:
+                        return False
+                in_flight[next_offset] = (pool.submit(_fetch_page, next_offset, batch_limit), batch_limit)
+                next_offset += batch_limit
+                return True
 
-                    if skip_paper_ids:
-                        pid = str(paper_data.get("id") or "").strip()
-                        if pid and pid in skip_paper_ids:
-                            continue
+            pool = ThreadPoolExecutor(max_workers=page_workers)
+            try:
+                while len(in_flight) < page_workers and _submit_next():
+                    pass
 
-                    papers.append(paper_data)
-                    fetched += 1
+                offset = start_offset
+                while offset in in_flight:
+                    fut, batch_limit = in_flight.pop(offset)
+                    submissions = fut.result()
 
-                    if total_target is not None and fetched >= total_target:
+                    if not submissions:
                         break
 
-                offset += len(submissions)
-
-                # UI 进度回调（按“已满足目标数量”汇报；accepted_only/skip_existing 时扫描更多 submission）
-                if callable(on_progress) and total_target is not None and total_target > 0:
-                    try:
-                        on_progress(
-                            {
-                                "stage": "fetch_papers",
-                                "current": min(fetched, total_target),
-                                "total": total_target,
-                                "scanned": seen,
-                                "accepted_only": bool(accepted_only),
-                                "skip_existing": bool(skip_paper_ids),
-                                "venue_id": venue_id,
-                            }
+                    for pos, submission in enumerate(submissions, start=offset):
+                        seen += 1
+                        paper_data = self._extract_paper_info(
+                            submission, content_fields, venue_id=venue_id, year=venue_year, include_replies=need_replies
                         )
-                    except Exception:
-                        pass
 
-                # 进度日志
-                if accepted_only:
-                    if (seen % 50 == 0) or (total_target is not None and fetched >= total_target):
-                        suffix = f"/{total_target}" if total_target is not None else ""
-                        print(f"  Scanned {seen} submissions · accepted {fetched}{suffix}")
-                else:
-                    if fetched % 10 == 0:
-                        suffix = f"/{total_target}" if total_target is not None else ""
-                        print(f"  Processed {fetched}{suffix} papers")
+                        if prefix_open:
+                            decision = str(paper_data.get("decision") or "").lower()
+                            pid = str(paper_data.get("id") or "").strip()
+                            if pid in skip_paper_ids:
+                                known_prefix_end, known_prefix_id = pos + 1, submission.id
+                                prefix_kb_ids.append(pid)
+                            elif accepted_only and decision and "accept" not in decision:
+                                known_prefix_end, known_prefix_id = pos + 1, submission.id
+                            else:
+                                prefix_open = False
 
-                if total_target is not None and fetched >= total_target:
-                    break
+                        if accepted_only:
+                            decision = paper_data.get("decision")
+                            d = str(decision or "").lower()
+                            if "accept" not in d:
+                                continue
+
+                        if skip_paper_ids:
+                            pid = str(paper_data.get("id") or "").strip()
+                            if pid and pid in skip_paper_ids:
+                                continue
+
+                        papers.append(paper_data)
+                        fetched += 1
+
+                        if total_target is not None and fetched >= total_target:
+                            break
 
-                if len(submissions) < batch_limit:
-                    # 读到末尾
-                    break
+                    offset += batch_limit
+
+                    # UI 进度回调（按“已满足目标数量”汇报；accepted_only/skip_existing 时扫描更多 submission）
+                    if callable(on_progress) and total_target is not None and total_target > 0:
+                        try:
+                            on_progress(
+                                {
+                                    "stage": "fetch_papers",
+                                    "current": min(fetched, total_target),
+                                    "total": total_target,
+                                    "scanned": seen,
+                                    "accepted_only": bool(accepted_only),
+                                    "skip_existing": bool(skip_paper_ids),
+                                    "venue_id": venue_id,
+                                }
+                            )
+                        except Exception:
+                            pass
+
+                    # 进度日志
+                    if accepted_only:
+                        if (seen % 50 == 0) or (total_target is not None and fetched >= total_target):
+                            suffix = f"/{total_target}" if total_target is not None else ""
+                            print(f"  Scanned {seen} submissions · accepted {fetched}{suffix}")
+                    else:
+                        if fetched % 10 == 0:
+                            suffix = f"/{total_target}" if total_target is not None else ""
+                            print(f"  Processed {fetched}{suffix} papers")
+
+                    if total_target is not None and fetched >= total_target:
+                        break
+
+                    if len(submissions) < batch_limit:
+                        # 读到末尾
+                        break
+
+                    _submit_next()
+            finally:
+                # 提前结束时，排队中的预取请求直接取消，不再等待
+                pool.shutdown(wait=False, cancel_futures=True)
+
+            if known_prefix_id is not None:
+                self._save_cursor(
+                    cursor_key, {"offset": known_prefix_end, "last_id": known_prefix_id, "kb_ids": prefix_kb_ids}
+                )
 
             if accepted_only:
                 print(f"[OK] Successfully fetched {len(papers)} accepted papers (scanned {seen} submissions)")
@@ -181,6 +501,116 @@ class ConferenceDataFetcher:
         
         return papers
     
+    def _cursor_path(self) -> str:
+        return os.path.join(self.output_dir, ".cursor.json")
+
+    def _load_cursors(self) -> Dict:
+        try:
+            with open(self._cursor_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save_cursor(self, key: str, cursor: Dict) -> None:
+        """把某会议的扫描游标写入 <output_dir>/.cursor.json（原子替换，失败只影响下次的扫描起点）。"""
+        try:
+            data = self._load_cursors()
+            data[key] = cursor
+            tmp = self._cursor_path() + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self._cursor_path())
+        except Exception as e:
+            print(f"Warning: failed to save OpenReview scan cursor: {e}")
+
+    def _resume_offset(
+        self,
+        invitation: str,
+        key: str,
+        content: Optional[Dict[str, str]] = None,
+        skip_paper_ids: Iterable[str] = (),
+    ) -> tuple[int, List[str]]:
+        """
+        追加抓取时的扫描起点：上次记录的游标之前的 submission 都已入库/已确定被过滤，无需重扫。
+        - 游标记录了前缀里已入库的 paper_id（kb_ids）：只要有一篇已不在 skip_paper_ids 里
+          （之后被删除 / 导入替换了知识库 / 元数据库被清空），就作废游标从头扫描，否则它永远不会被重新抓取
+        - 再取游标前一条 note 核对 id，排序有变化（新增投稿/撤稿等）也从头扫描
+        返回 (起始 offset, 前缀中已入库的 id 列表)；从头扫描时为 (0, [])。
+        """
+        if (os.getenv("MUJICA_OPENREVIEW_CURSOR", "1") or "1").strip().lower() in {"0", "false", "no", "off"}:
+            return 0, []
+        cur = self._load_cursors().get(key)
+        try:
+            off = int((cur or {}).get("offset") or 0)
+            kb_ids = cur.get("kb_ids") if off > 0 else None
+            if not isinstance(kb_ids, list):
+                # 没有游标，或旧格式游标（无法核对知识库）
+                return 0, []
+            if any(pid not in skip_paper_ids for pid in kb_ids):
+                print("  Scan cursor dropped: papers before it are no longer in the knowledge base")
+                return 0, []
+            probe = self._get_notes(invitation=invitation, details=None, limit=1, offset=off - 1, content=content)
+            if probe and probe[0].id == cur.get("last_id"):
+                return off, list(kb_ids)
+        except Exception:
+            pass
+        return 0, []
+
+    def _get_notes(
+        self,
+        *,
+        invitation: str,
+        details: Optional[str],
+        limit: int,
+        offset: int,
+        content: Optional[Dict[str, str]] = None,
+    ):
+        """
+        client.get_notes 的快速版本（需设置 MUJICA_OPENREVIEW_FAST_JSON=1 开启）：同一个 session/URL/headers 发请求，
+        但用 orjson 解析响应体，再用 SDK 的 Note.from_json 构造对象，返回值与 get_notes 完全一致。
+        依赖 SDK 的内部属性（session/notes_url/headers），默认关闭；orjson 不可用或属性缺失时走 SDK。
+        """
+        fast = orjson is not None and (os.getenv("MUJICA_OPENREVIEW_FAST_JSON", "0") or "0").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "y",
+            "on",
+        }
+        if fast:
+            params = {"invitation": invitation, "limit": limit, "offset": offset}
+            if details is not None:
+                params["details"] = details
+            for k, v in (content or {}).items():
+                params["content." + k] = v
+            try:
+                resp = self.client.session.get(self.client.notes_url, params=params, headers=self.client.headers)
+            except AttributeError:
+                resp = None  # SDK 内部属性变了：退回公开 API
+            if resp is not None:
+                # 429/5xx 等直接按这次响应报错，不再经 SDK 重发同一请求（限流时只会加重负担）
+                resp.raise_for_status()
+                return [openreview.api.Note.from_json(n) for n in orjson.loads(resp.content)["notes"]]
+        return self.client.get_notes(
+            invitation=invitation, details=details, limit=limit, offset=offset, content=content
+        )
+
+    def _accepted_filter(self, invitation: str, venue_id: str) -> Optional[Dict[str, str]]:
+        """
+        OpenReview v2 中被接收论文的 content.venueid 就是会议 ID（被拒/撤稿为 .../Rejected_Submission 等），
+        可以让服务端只返回接收论文。决策公布前 venueid 尚未设置：探测不到就返回 None，走客户端过滤。
+        """
+        if (os.getenv("MUJICA_OPENREVIEW_VENUEID_FILTER", "1") or "1").strip().lower() in {"0", "false", "no", "off"}:
+            return None
+        flt = {"venueid": venue_id}
+        try:
+            if self._get_notes(invitation=invitation, details=None, limit=1, offset=0, content=flt):
+                return flt
+        except Exception as e:
+            print(f"  venueid filter unavailable ({e}); scanning all submissions")
+        return None
+
     def _parse_numeric_score(self, value) -> Optional[float]:
         """
         OpenReview 的 rating/confidence 常见格式：
@@ -193,7 +623,7 @@ class ConferenceDataFetcher:
         if isinstance(value, (int, float)):
             return float(value)
         if isinstance(value, str):
-            m = re.search(r"(-?\d+(?:\.\d+)?)", value)
+            m = _NUM_RE.search(value)
             if m:
                 try:
                     return float(m.group(1))
@@ -202,7 +632,7 @@ class ConferenceDataFetcher:
         return None
 
     def _extract_year_from_venue(self, venue_id: str) -> Optional[int]:
-        m = re.search(r"\b(20\d{2})\b", venue_id or "")
+        m = _YEAR_RE.search(venue_id or "")
         if not m:
             return None
         try:
@@ -210,13 +640,22 @@ class ConferenceDataFetcher:
         except Exception:
             return None
 
-    def _extract_paper_info(self, submission, content_fields: List[str], venue_id: str) -> Dict:
+    def _extract_paper_info(
+        self,
+        submission,
+        content_fields: List[str],
+        venue_id: str,
+        year: Optional[int] = None,
+        include_replies: bool = True,
+    ) -> Dict:
         """
         从 OpenReview submission 对象中提取论文信息
         
         Args:
             submission: OpenReview Note 对象
             content_fields: 需要提取的字段列表
+            year: 已解析好的会议年份（同一会议的论文共用，None 时从 venue_id 解析）
+            include_replies: False 时不遍历 replies（评审/决策/rebuttal 字段保持空值）
         
         Returns:
             包含论文信息的字典
@@ -226,7 +665,7 @@ class ConferenceDataFetcher:
             "forum": submission.forum,
             "number": submission.number if hasattr(submission, 'number') else None,
             "venue_id": venue_id,
-            "year": self._extract_year_from_venue(venue_id),
+            "year": year if year is not None else self._extract_year_from_venue(venue_id),
         }
         
         # 提取内容字段
@@ -256,45 +695,17 @@ class ConferenceDataFetcher:
         # 提取 TL;DR（如果有）
         paper['tldr'] = content.get('TL;DR', {}).get('value', '')
         
-        def _val(obj: Dict, key: str, default=None):
-            if not isinstance(obj, dict):
-                return default
-            v = obj.get(key, default)
-            if isinstance(v, dict) and "value" in v:
-                return v.get("value", default)
-            return v
-
-        def _parse_presentation(decision: Optional[str]) -> Optional[str]:
-            """
-            从 decision 字符串中提取展示类型（oral/spotlight/poster）。
-            不同会议/年份的 decision 文本格式可能不同，因此做宽松匹配。
-            """
-            if not decision:
-                return None
-            d = str(decision).lower()
-            # 常见形式：Accept (Oral) / Accept (Spotlight) / Accept (Poster)
-            if "oral" in d:
-                return "oral"
-            if "spotlight" in d:
-                return "spotlight"
-            if "poster" in d:
-                return "poster"
-            # 有的会写 talk / presentation
-            if "talk" in d:
-                return "oral"
-            # 接收但未标明展示类型
-            if "accept" in d:
-                return "unknown"
-            return None
-
         # 提取决策信息（如果有评审）
         paper['decision'] = None
         paper['decision_text'] = None  # 决策 note 的正文（如 comment/理由等）
         paper['presentation'] = None
         paper['reviews'] = []
         paper['rebuttal_text'] = None  # 作者 rebuttal/response 的正文（可能有多条，合并保存）
+        # 论文级别评分：构建 reviews 时顺带累加，不再二次遍历
+        rating_sum = 0.0
+        rating_cnt = 0
         
-        if hasattr(submission, 'details') and submission.details:
+        if include_replies and getattr(submission, 'details', None):
             replies = submission.details.get('replies', [])
             # 记录“最新的决策 note”（按时间选择）
             best_decision_cdate = -1
@@ -311,24 +722,23 @@ class ConferenceDataFetcher:
                 reply_content = reply.get('content', {}) or {}
 
                 invs_l = [str(s).lower() for s in invs]
-                is_official_review = any(("official_review" in s) or ("official review" in s) for s in invs_l)
+                # 所有 invitation 拼成一个串做子串判断（换行分隔，标记词不会跨 invitation 误匹配）
+                inv_blob = "\n".join(invs_l)
+                is_official_review = ("official_review" in inv_blob) or ("official review" in inv_blob)
                 # decision invitation 常见包含 "Decision"；也可能只有 content 里带 decision 字段
-                is_decision = any("decision" in s for s in invs_l)
+                is_decision = "decision" in inv_blob
                 # meta review invitation：常见为 Meta_Review / Meta Review / metareview
-                is_meta_review = any(
-                    ("meta_review" in s) or ("metareview" in s) or ("meta review" in s) for s in invs_l
+                is_meta_review = (
+                    ("meta_review" in inv_blob) or ("metareview" in inv_blob) or ("meta review" in inv_blob)
                 )
-                # rebuttal / author response invitation
-                is_rebuttal = any(
-                    ("rebuttal" in s)
-                    or ("author_rebuttal" in s)
-                    or ("author rebuttal" in s)
-                    or ("author_response" in s)
-                    or ("author response" in s)
-                    or ("response" in s and "author" in s)
-                    for s in invs_l
+                # rebuttal / author response invitation（author_rebuttal 等已被 "rebuttal" 覆盖）
+                is_rebuttal = (
+                    ("rebuttal" in inv_blob)
+                    or ("author_response" in inv_blob)
+                    or ("author response" in inv_blob)
+                    or any("response" in s and "author" in s for s in invs_l)
                 )
-                has_rating = any(k in reply_content for k in ["rating", "recommendation", "overall_rating", "score"])
+                has_rating = not _RATING_KEYS.isdisjoint(reply_content)
                 has_decision = "decision" in reply_content
                 
                 # 检查是否是评审
@@ -345,10 +755,7 @@ class ConferenceDataFetcher:
                             embedded_rebuttal = vv.strip()
                             break
                     if embedded_rebuttal:
-                        try:
-                            cdate = int(reply.get("cdate") or reply.get("tcdate") or 0)
-                        except Exception:
-                            cdate = 0
+                        cdate = _cdate(reply)
                         tag = f"Author response (from review note, cdate={cdate})" if cdate else "Author response (from review note)"
                         rebuttal_blocks.append(f"{tag}:\n{embedded_rebuttal}".strip())
 
@@ -369,45 +776,13 @@ class ConferenceDataFetcher:
                     weaknesses = _val(review_content, "weaknesses", "") or ""
 
                     # 额外字段：把较长的文本字段也纳入（避免只有 checklist/短答）
-                    skip_keys = {
-                        # 打分/决策类
-                        "rating",
-                        "recommendation",
-                        "overall_rating",
-                        "score",
-                        "confidence",
-                        "overall_confidence",
-                        "decision",
-                        # 作者回应类（放到 paper-level rebuttal_text；不混进 reviewer 文本）
-                        "rebuttal",
-                        "author_response",
-                        "author comment",
-                        "author_comment",
-                        "response",
-                        # 常见短字段
-                        "title",
-                    }
-                    extra_pairs = []
+                    # 只取前若干个，避免把整张表单都塞进单条 review（过长会影响吞吐/embedding 成本）；
+                    # islice 取够 10 个就停，不再遍历整张表单
                     try:
-                        for k in (review_content or {}).keys():
-                            if k in skip_keys or k in {"summary", "strengths", "weaknesses"}:
-                                continue
-                            vv = _val(review_content, k, None)
-                            if not isinstance(vv, str):
-                                continue
-                            ss = vv.strip()
-                            if not ss:
-                                continue
-                            # 过滤掉过短的 Yes/No/checklist 类内容
-                            if len(ss) < 20:
-                                continue
-                            extra_pairs.append((str(k), ss))
+                        extra_pairs = list(itertools.islice(_long_text_fields(review_content), 10))
                     except Exception:
                         extra_pairs = []
 
-                    # 只取前若干个，避免把整张表单都塞进单条 review（过长会影响吞吐/embedding 成本）
-                    extra_pairs = extra_pairs[:10]
-
                     text_parts = []
                     if rating_raw is not None:
                         text_parts.append(f"Rating: {rating_raw}")
@@ -421,8 +796,8 @@ class ConferenceDataFetcher:
                         text_parts.append(f"Weaknesses:\n{weaknesses.strip()}")
                     for k, ss in extra_pairs:
                         text_parts.append(f"{k}:\n{ss}")
-                    # FORCE STRING CONVERSION: Defensive coding against non-string items
-                    review_text = "\n\n".join([str(x) for x in text_parts if x]).strip()
+                    # 各段都是上面拼好的非空 f-string，直接 join
+                    review_text = "\n\n".join(text_parts).strip()
 
                     review_data = {
                         'rating_raw': str(rating_raw) if rating_raw is not None else 'N/A',
@@ -435,25 +810,18 @@ class ConferenceDataFetcher:
                         'text': review_text,
                     }
                     paper['reviews'].append(review_data)
+                    if isinstance(review_data['rating'], (int, float)):
+                        rating_sum += review_data['rating']
+                        rating_cnt += 1
 
                 # 检查是否是 rebuttal / author response
                 elif is_rebuttal:
                     # 尽量保留作者回应的完整表单内容（Common concerns / Final comments 等可能在不同字段里）
-                    skip_keys = {
-                        "rating",
-                        "recommendation",
-                        "overall_rating",
-                        "score",
-                        "confidence",
-                        "overall_confidence",
-                        "decision",
-                        "title",
-                    }
                     blocks = []
                     seen_txt = set()
                     try:
                         for k in (reply_content or {}).keys():
-                            if k in skip_keys:
+                            if k in _REBUTTAL_SKIP_KEYS:
                                 continue
                             vv = _val(reply_content, k, None)
                             if not isinstance(vv, str):
@@ -476,12 +844,9 @@ class ConferenceDataFetcher:
                     except Exception:
                         blocks = []
 
-                    main_text = "\n\n".join([x for x in blocks if x]).strip()
+                    main_text = "\n\n".join(blocks).strip()
                     if main_text:
-                        try:
-                            cdate = int(reply.get("cdate") or reply.get("tcdate") or 0)
-                        except Exception:
-                            cdate = 0
+                        cdate = _cdate(reply)
                         tag = f"Rebuttal/Response (cdate={cdate})" if cdate else "Rebuttal/Response"
                         rebuttal_blocks.append(f"{tag}:\n{main_text}".strip())
                 
@@ -505,12 +870,9 @@ class ConferenceDataFetcher:
                         decision_text_parts.append(f"Decision: {str(decision_value).strip()}")
                     if comment:
                         decision_text_parts.append(comment)
-                    decision_text = "\n\n".join([x for x in decision_text_parts if x]).strip() or None
+                    decision_text = "\n\n".join(decision_text_parts).strip() or None
 
-                    try:
-                        cdate = int(reply.get("cdate") or reply.get("tcdate") or 0)
-                    except Exception:
-                        cdate = 0
+                    cdate = _cdate(reply)
 
                     # 选择“最新的一条 decision note”作为最终 decision
                     if decision_value is not None and (cdate >= best_decision_cdate):
@@ -553,8 +915,7 @@ class ConferenceDataFetcher:
                         paper["presentation"] = _parse_presentation(vv)
 
         # 计算论文级别评分（兼容旧字段名 rating）
-        numeric_ratings = [r.get("rating") for r in paper["reviews"] if isinstance(r.get("rating"), (int, float))]
-        paper["rating"] = float(sum(numeric_ratings) / len(numeric_ratings)) if numeric_ratings else None
+        paper["rating"] = rating_sum / rating_cnt if rating_cnt else None
         
         return paper
     
@@ -595,6 +956,54 @@ class ConferenceDataFetcher:
             print(f"Error searching for paper: {e}")
             return None
     
+    def _pdf_session(self) -> requests.Session:
+        """
+        所有下载线程、所有批次共用一个 Session：连接池按最大并发数开，
+        keep-alive 的 TLS 连接在 ingest 的各个 batch 之间持续复用，不再每批重新握手。
+        （重试由 download_pdfs 自己做，adapter 不重试）
+        """
+        with self._pdf_http_lock:
+            if self._pdf_http is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_PDF_DOWNLOAD_MAX_WORKERS, max_retries=0)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                self._pdf_http = s
+            return self._pdf_http
+
+    def _valid_cache_path(self) -> str:
+        return os.path.join(self.pdf_dir, ".valid_cache.json")
+
+    def _valid_cache_for(self, sig: str) -> Dict[str, list]:
+        """
+        已有 PDF 的校验结果 {文件名: [mtime_ns, size, valid]}，落盘在 <pdf_dir>/.valid_cache.json。
+        mtime/size 没变的文件直接复用上次结论，重复运行时不再逐个打开校验。
+        sig 是校验参数（min_bytes/EOF 检查），参数变了整份缓存作废。
+        """
+        if self._valid_cache is None or self._valid_cache.get("sig") != sig:
+            data = None
+            try:
+                with open(self._valid_cache_path(), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception:
+                pass
+            if not (isinstance(data, dict) and data.get("sig") == sig and isinstance(data.get("files"), dict)):
+                data = {"sig": sig, "files": {}}
+            self._valid_cache = data
+        return self._valid_cache["files"]
+
+    def _save_valid_cache(self) -> None:
+        """原子替换写回校验缓存（失败只影响下次是否重新校验）。"""
+        if self._valid_cache is None:
+            return
+        try:
+            tmp = self._valid_cache_path() + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._valid_cache, f, ensure_ascii=False)
+            os.replace(tmp, self._valid_cache_path())
+        except Exception as e:
+            print(f"Warning: failed to save PDF validation cache: {e}")
+
     def download_pdfs(self, papers: List[Dict], max_downloads: Optional[int] = None, on_progress=None):
         """
         下载论文 PDF
@@ -607,7 +1016,7 @@ class ConferenceDataFetcher:
 
         # 并发下载：显著加速（默认 6 线程），并将旧实现的 0.5s 固定 sleep 改为可配置
         max_workers = int(os.getenv("MUJICA_PDF_DOWNLOAD_WORKERS", "6") or 6)
-        max_workers = max(1, min(max_workers, 16))
+        max_workers = max(1, min(max_workers, _PDF_DOWNLOAD_MAX_WORKERS))
         delay = float(os.getenv("MUJICA_PDF_DOWNLOAD_DELAY", "0.0") or 0.0)
         delay = max(0.0, min(delay, 5.0))
         timeout = float(os.getenv("MUJICA_PDF_DOWNLOAD_TIMEOUT", "60") or 60)
@@ -641,41 +1050,43 @@ class ConferenceDataFetcher:
             min_bytes = 10240
         min_bytes = max(0, min(min_bytes, 50_000_000))
 
-        # thread-local session（减少重复握手/提升吞吐）
-        _local = threading.local()
+        session = self._pdf_session()
+        # 自适应并发：跨批次保留（ingest 每批都会调 download_pdfs），worker 上限变了才重建
+        if self._pdf_limiter is None or self._pdf_limiter.max_limit != max_workers:
+            self._pdf_limiter = _AdaptiveLimit(max_workers)
+        limiter = self._pdf_limiter
 
-        def _session():
-            s = getattr(_local, "session", None)
-            if s is None:
-                s = requests.Session()
-                _local.session = s
-            return s
+        def _pdf_ok(head: bytes, tail: bytes, size: int) -> bool:
+            if min_bytes > 0 and size < min_bytes:
+                return False
+            if head[:5] != b"%PDF-":
+                return False
+            # EOF 通常在尾部附近，查最后 2KB
+            return (not eof_check) or (b"%%EOF" in tail)
 
-        def _is_valid_pdf(path: str) -> bool:
-            if not path or not os.path.exists(path):
+        def _is_valid_pdf(path: str, size: Optional[int] = None) -> bool:
+            """size 由调用方（预扫描的 scandir 结果）给出时不再额外 stat。"""
+            if not path:
                 return False
             try:
-                sz = os.path.getsize(path)
+                # 裸 fd + read/lseek（跨平台；os.pread 在 Windows 上没有），不经过 Python 文件对象
+                fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except OSError:
+                return False
+            try:
+                sz = os.fstat(fd).st_size if size is None else size
                 if min_bytes > 0 and sz < min_bytes:
                     return False
-                with open(path, "rb") as f:
-                    head = f.read(5)
-                    if not head.startswith(b"%PDF-"):
-                        return False
-                    if eof_check:
-                        # EOF 通常在尾部附近，读最后 2KB 检查
-                        try:
-                            tail_size = 2048
-                            if sz > tail_size:
-                                f.seek(-tail_size, os.SEEK_END)
-                            tail = f.read(tail_size)
-                        except Exception:
-                            tail = b""
-                        if b"%%EOF" not in tail:
-                            return False
-                return True
-            except Exception:
+                head = os.read(fd, 5)
+                tail = b""
+                if eof_check and head == b"%PDF-":
+                    os.lseek(fd, max(0, sz - 2048), os.SEEK_SET)
+                    tail = os.read(fd, 2048)
+                return _pdf_ok(head, tail, sz)
+            except OSError:
                 return False
+            finally:
+                os.close(fd)
 
         def _download_one(idx: int, paper: Dict) -> Dict:
             pdf_url = paper.get("pdf_url", "")
@@ -685,67 +1096,71 @@ class ConferenceDataFetcher:
             paper_id = paper.get("id", f"paper_{idx}")
             filename = f"{paper_id}.pdf"
             filepath = os.path.join(self.pdf_dir, filename)
+            # 是否已存在/是否损坏由下面的预扫描统一判定，这里只负责下载（损坏文件直接覆盖重下）
 
-            if (not force_redownload) and os.path.exists(filepath):
-                if (not validate_existing) or _is_valid_pdf(filepath):
-                    paper["pdf_path"] = filepath
-                    return {"idx": idx, "paper_id": paper_id, "status": "exists", "filepath": filepath}
-                # 存在但疑似损坏：触发重下
-                return {"idx": idx, "paper_id": paper_id, "status": "need_redownload", "filepath": filepath}
+            # 先写 .part，下完再原子替换；中途断开（含上次运行崩溃）时用 Range 续传已下载的部分
+            part_path = filepath + ".part"
 
             last_err = None
+            backoff = _BACKOFF_BASE
             for attempt in range(retries + 1):
                 try:
                     if delay > 0:
                         # 加一点 jitter，避免多线程同时打爆
                         time.sleep(delay * (0.85 + random.random() * 0.30))
-                    resp = _session().get(
-                        pdf_url,
-                        timeout=timeout,
-                        stream=True,
-                        headers={
-                            "User-Agent": "MUJICA/1.0 (+https://openreview.net)",
-                            "Accept": "application/pdf,*/*;q=0.8",
-                        },
-                    )
-                    resp.raise_for_status()
-                    with open(filepath, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=1024 * 256):
-                            if chunk:
-                                f.write(chunk)
-                    # 基本校验（避免写入 HTML/错误页）
-                    if validate_existing and (not _is_valid_pdf(filepath)):
-                        raise RuntimeError("downloaded_file_is_not_valid_pdf")
+                    headers = {
+                        "User-Agent": "MUJICA/1.0 (+https://openreview.net)",
+                        "Accept": "application/pdf,*/*;q=0.8",
+                        # 不要压缩编码：Range 偏移按原始字节计算，.part 里也必须是原始字节（PDF 本身已压缩）
+                        "Accept-Encoding": "identity",
+                    }
+                    existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                    if existing > 0:
+                        headers["Range"] = f"bytes={existing}-"
+                    # 拿到自适应并发名额才发请求（被限流时并发自动收缩，退避 sleep 期间不占名额）
+                    with limiter.slot():
+                        # with：出错时也及时把连接还回共享连接池
+                        with session.get(pdf_url, timeout=timeout, stream=True, headers=headers) as resp:
+                            if existing > 0 and resp.status_code == 416:
+                                # .part 已不对应服务器上的文件（长度不符）：丢弃，下次重试从头下载
+                                os.remove(part_path)
+                                raise RuntimeError("stale_partial_download")
+                            resp.raise_for_status()
+                            # 206 才是续传；服务器忽略 Range 返回 200 时从头写
+                            mode = "ab" if (existing > 0 and resp.status_code == 206) else "wb"
+                            # 直接从底层流按 1MB 块拷贝（比 iter_content 的生成器少一层拷贝/调用）；
+                            # decode_content 保证万一仍有传输编码时也被解开；
+                            # 写端缓冲也开到 1MB：底层 read 返回短块时合并成大块再落盘，而不是按默认 8KB 频繁 write
+                            resp.raw.decode_content = True
+                            with open(part_path, mode, buffering=1024 * 1024) as f:
+                                sniff = _PdfSniffWriter(f)
+                                if mode == "ab":
+                                    # 续传：开头和（可能不足 2KB 的新数据之前的）尾部在已有的 .part 里
+                                    with open(part_path, "rb") as rf:
+                                        sniff.head = rf.read(5)
+                                        rf.seek(max(0, existing - 2048))
+                                        sniff.tail[:] = rf.read(2048)
+                                    sniff.size = existing
+                                shutil.copyfileobj(resp.raw, sniff, 1024 * 1024)
+                        # 基本校验（避免写入 HTML/错误页）：用写入时顺手记下的头尾判断，不再把文件读回来
+                        if validate_existing and (not _pdf_ok(sniff.head, sniff.tail, sniff.size)):
+                            # 内容不对就整份丢掉，重试时从头下载（而不是在错误内容后面续传）
+                            os.remove(part_path)
+                            raise RuntimeError("downloaded_file_is_not_valid_pdf")
+                    os.replace(part_path, filepath)
+                    limiter.success()
                     paper["pdf_path"] = filepath
                     return {"idx": idx, "paper_id": paper_id, "status": "downloaded", "filepath": filepath}
                 except Exception as e:
                     last_err = e
-                    # 简单退避
+                    if getattr(getattr(e, "response", None), "status_code", None) in {429, 503}:
+                        limiter.shrink()
                     if attempt < retries:
-                        # 429/503 等更长退避；如果有 Retry-After，优先遵守
-                        wait = min(1.0 * (2**attempt), 8.0)
-                        try:
-                            resp = getattr(e, "response", None)
-                            if resp is not None and hasattr(resp, "status_code"):
-                                sc = int(getattr(resp, "status_code") or 0)
-                                if sc in {429, 503, 502, 504}:
-                                    ra = None
-                                    try:
-                                        ra = resp.headers.get("Retry-After") or resp.headers.get("retry-after")
-                                    except Exception:
-                                        ra = None
-                                    if ra is not None:
-                                        try:
-                                            wait = max(wait, float(ra))
-                                        except Exception:
-                                            pass
-                                    wait = max(wait, 2.0)
-                                if sc == 404:
-                                    # 404 基本不可能成功，直接退出重试
-                                    break
-                        except Exception:
-                            pass
-                        time.sleep(min(wait, 60.0))
+                        backoff = _backoff_delay(backoff, getattr(e, "response", None))
+                        if backoff is None:
+                            # 404/401/403 重试也不会成功，直接退出
+                            break
+                        time.sleep(backoff)
             return {"idx": idx, "paper_id": paper_id, "status": "failed", "error": str(last_err)}
 
         # 预扫描：把“已存在且有效”的直接标记为 exists，不占用下载任务
@@ -755,25 +1170,74 @@ class ConferenceDataFetcher:
         skipped = 0
         need_redownload = 0
 
-        for idx, p in enumerate(papers):
-            pdf_url = p.get("pdf_url", "")
-            if not pdf_url:
+        valid_cache = self._valid_cache_for(f"{min_bytes}:{int(eof_check)}")
+        cache_dirty = False
+
+        def _remember_valid(filepath: str, valid: bool, st: Optional[os.stat_result] = None) -> None:
+            nonlocal cache_dirty
+            if st is None:
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    return
+            valid_cache[os.path.basename(filepath)] = [st.st_mtime_ns, st.st_size, valid]
+            cache_dirty = True
+
+        # 一次 scandir 拿到 pdf_dir 里所有已有文件的 stat（Windows 上直接来自目录项，不再逐个 stat），
+        # 不存在的文件也不用再各 stat 一次失败
+        existing: Dict[str, os.stat_result] = {}
+        if not force_redownload:
+            wanted = {f"{p.get('id', f'paper_{idx}')}.pdf" for idx, p in enumerate(papers) if p.get("pdf_url")}
+            try:
+                with os.scandir(self.pdf_dir) as it:
+                    for entry in it:
+                        if entry.name in wanted:
+                            try:
+                                existing[entry.name] = entry.stat()
+                            except OSError:
+                                pass
+            except OSError:
+                pass
+
+        def _classify(idx: int, p: Dict) -> str:
+            if not p.get("pdf_url", ""):
+                return "skipped"
+            filename = f"{p.get('id', f'paper_{idx}')}.pdf"
+            st = existing.get(filename)
+            if st is None:
+                # 不存在，或 force_redownload（此时 existing 为空）
+                return "download"
+            if not validate_existing:
+                return "exists"
+            hit = valid_cache.get(filename)
+            if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                valid = bool(hit[2])
+            else:
+                filepath = os.path.join(self.pdf_dir, filename)
+                valid = _is_valid_pdf(filepath, st.st_size)
+                _remember_valid(filepath, valid, st)
+            # 存在但疑似损坏：加入下载队列
+            return "exists" if valid else "need_redownload"
+
+        # 校验已有文件是纯磁盘 I/O（增量抓取时几乎全是已存在文件），并行扫描；map 保持原顺序
+        scan_workers = max(1, min(32, (os.cpu_count() or 1) * 2, len(papers)))
+        with ThreadPoolExecutor(max_workers=scan_workers) as ex:
+            statuses = list(ex.map(_classify, range(len(papers)), papers))
+
+        for idx, (p, st) in enumerate(zip(papers, statuses)):
+            if st == "skipped":
                 skipped += 1
                 pre_results.append({"idx": idx, "paper_id": p.get("id"), "status": "skipped", "error": "no_pdf_url"})
                 continue
-
-            paper_id = p.get("id", f"paper_{idx}")
-            filepath = os.path.join(self.pdf_dir, f"{paper_id}.pdf")
-
-            if (not force_redownload) and os.path.exists(filepath):
-                if (not validate_existing) or _is_valid_pdf(filepath):
-                    p["pdf_path"] = filepath
-                    exists += 1
-                    pre_results.append({"idx": idx, "paper_id": paper_id, "status": "exists", "filepath": filepath})
-                    continue
-                # 存在但疑似损坏：加入下载队列
+            if st == "exists":
+                paper_id = p.get("id", f"paper_{idx}")
+                filepath = os.path.join(self.pdf_dir, f"{paper_id}.pdf")
+                p["pdf_path"] = filepath
+                exists += 1
+                pre_results.append({"idx": idx, "paper_id": paper_id, "status": "exists", "filepath": filepath})
+                continue
+            if st == "need_redownload":
                 need_redownload += 1
-
             download_targets.append((idx, p))
 
         # max_downloads：限制“需要网络下载”的数量（不包含 exists）
@@ -784,7 +1248,6 @@ class ConferenceDataFetcher:
         done = 0
         downloaded = 0
         failed = 0
-        redownloaded = 0
 
         # 先把预扫描结果也计入进度（exists/skipped）
         for r in pre_results:
@@ -803,37 +1266,69 @@ class ConferenceDataFetcher:
                 except Exception:
                     pass
 
+        # 同一个 pdf_url 只下载一次（撤稿重投/重复投稿可能指向同一份 PDF），其余论文 hardlink（失败则复制）过去
+        by_url: Dict[str, List[tuple[int, Dict]]] = {}
+        for idx, p in download_targets:
+            by_url.setdefault(p["pdf_url"], []).append((idx, p))
+        deduped = 0
+
+        def _link_duplicate(r: Dict, idx: int, paper: Dict) -> Dict:
+            paper_id = paper.get("id", f"paper_{idx}")
+            if r.get("status") != "downloaded":
+                return {"idx": idx, "paper_id": paper_id, "status": "failed", "error": r.get("error")}
+            src = r["filepath"]
+            dst = os.path.join(self.pdf_dir, f"{paper_id}.pdf")
+            try:
+                if os.path.abspath(dst) != os.path.abspath(src):
+                    if os.path.exists(dst):
+                        os.remove(dst)
+                    try:
+                        os.link(src, dst)
+                    except OSError:
+                        shutil.copyfile(src, dst)
+            except Exception as e:
+                return {"idx": idx, "paper_id": paper_id, "status": "failed", "error": str(e)}
+            paper["pdf_path"] = dst
+            return {"idx": idx, "paper_id": paper_id, "status": "downloaded", "filepath": dst}
+
         with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = [ex.submit(_download_one, idx, p) for idx, p in download_targets]
+            futures = {ex.submit(_download_one, *group[0]): group[1:] for group in by_url.values()}
             for fut in as_completed(futures):
-                r = fut.result()
-                done += 1
-                status = r.get("status")
-                if status == "downloaded":
-                    downloaded += 1
-                elif status == "need_redownload":
-                    redownloaded += 1
-                elif status == "failed":
-                    failed += 1
-
-                if callable(on_progress):
-                    try:
-                        on_progress(
-                            {
-                                "stage": "download_pdf",
-                                "current": done,
-                                "total": total,
-                                "paper_id": r.get("paper_id"),
-                                "status": status,
-                            }
-                        )
-                    except Exception:
-                        pass
+                r0 = fut.result()
+                results = [r0] + [_link_duplicate(r0, idx, p) for idx, p in futures[fut]]
+                deduped += len(futures[fut])
+                for r in results:
+                    done += 1
+                    status = r.get("status")
+                    if status == "downloaded":
+                        downloaded += 1
+                        if validate_existing:
+                            # 刚下载的文件已经校验过，记进缓存，下次运行不必再打开
+                            _remember_valid(r["filepath"], True)
+                    elif status == "failed":
+                        failed += 1
+
+                    if callable(on_progress):
+                        try:
+                            on_progress(
+                                {
+                                    "stage": "download_pdf",
+                                    "current": done,
+                                    "total": total,
+                                    "paper_id": r.get("paper_id"),
+                                    "status": status,
+                                }
+                            )
+                        except Exception:
+                            pass
+
+        if cache_dirty:
+            self._save_valid_cache()
 
         succeeded = exists + downloaded
         print(
             f"\n[OK] Download complete: {succeeded} ok (downloaded={downloaded}, exists={exists}), "
-            f"{failed} failed, {skipped} skipped"
+            f"{failed} failed, {skipped} skipped, {deduped} shared url"
             f" (workers={max_workers}, delay={delay}s, retries={retries}, timeout={timeout}s, "
             f"force_redownload={force_redownload}, validate_existing={validate_existing}, min_bytes={min_bytes})"
         )
@@ -861,33 +1356,29 @@ class ConferenceDataFetcher:
         
         try:
             submission_invitation = f"{venue_id}/-/Submission"
-            submissions = self.client.get_all_notes(
-                invitation=submission_invitation,
-                details='replies'
-            )
-            
-            stats["total_submissions"] = len(submissions)
-            
-            # 统计决策
-            for submission in submissions:
-                if hasattr(submission, 'details') and submission.details:
-                    replies = submission.details.get('replies', [])
-                    for reply in replies:
-                        invs = reply.get("invitations") or []
-                        if isinstance(invs, str):
-                            invs = [invs]
-                        if any("Decision" in str(s) for s in (invs or [])) or ("decision" in (reply.get("content") or {})):
-                            decision = (reply.get('content', {}) or {}).get('decision', {})
-                            if isinstance(decision, dict):
-                                decision = decision.get('value', '')
-                            decision = str(decision or '').lower()
-                            if 'accept' in decision:
-                                stats["accepted"] += 1
-                            elif 'reject' in decision:
-                                stats["rejected"] += 1
-                            break
+            # 先用一条 note 探测 content.venueid（与 fetch_papers 的 accepted_only 过滤同一探测）：
+            # 决策公布后 OpenReview v2 会把结果写进 venueid（接收 = 会议 ID，被拒 = .../Rejected_Submission、
+            # .../Desk_Rejected_Submission），此时不带 replies 拉一遍即可分类；
+            # 探测不到（决策未公布 / 会议不维护 venueid / 已关闭此路径）则照旧带 replies 逐篇看 Decision 回复。
+            # 两条路径二选一，只扫描一遍
+            if self._accepted_filter(submission_invitation, venue_id) is not None:
+                submissions = self.client.get_all_notes(invitation=submission_invitation)
+                stats["total_submissions"] = len(submissions)
+                for submission in submissions:
+                    vid = str(_val(getattr(submission, "content", None) or {}, "venueid", "") or "")
+                    if vid == venue_id:
+                        stats["accepted"] += 1
+                    elif vid.endswith("Rejected_Submission"):
+                        stats["rejected"] += 1
                     else:
                         stats["pending"] += 1
+            else:
+                submissions = self.client.get_all_notes(
+                    invitation=submission_invitation,
+                    details='replies'
+                )
+                stats["total_submissions"] = len(submissions)
+                self._count_decisions_from_replies(submissions, stats)
             
             print(f"[OK] Stats: {stats['total_submissions']} total, "
                   f"{stats['accepted']} accepted, "
@@ -898,3 +1389,26 @@ class ConferenceDataFetcher:
             print(f"Error fetching stats: {e}")
         
         return stats
+
+    @staticmethod
+    def _count_decisions_from_replies(submissions: List, stats: Dict) -> None:
+        """按每篇 submission 的 Decision 回复统计 accepted/rejected/pending（需 details='replies'）。"""
+        for submission in submissions:
+            if hasattr(submission, 'details') and submission.details:
+                replies = submission.details.get('replies', [])
+                for reply in replies:
+                    invs = reply.get("invitations") or []
+                    if isinstance(invs, str):
+                        invs = [invs]
+                    if any("Decision" in str(s) for s in (invs or [])) or ("decision" in (reply.get("content") or {})):
+                        decision = (reply.get('content', {}) or {}).get('decision', {})
+                        if isinstance(decision, dict):
+                            decision = decision.get('value', '')
+                        decision = str(decision or '').lower()
+                        if 'accept' in decision:
+                            stats["accepted"] += 1
+                        elif 'reject' in decision:
+                            stats["rejected"] += 1
+                        break
+                else:
+                    stats["pending"] += 1
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.data_engine.fetcher import ConferenceDataFetcher
 from src.data_engine.parser import PDFParser
 from src.data_engine.storage import KnowledgeBase
 
 
+def _parse_workers_default() -> int:
+    # PDF 解析是 CPU 密集（PyMuPDF 也不支持多线程），用多进程；默认最多 4 个，避免抢占 embedding
+    try:
+        n = int(os.getenv("MUJICA_PDF_PARSE_WORKERS", "") or 0)
+    except ValueError:
+        n = 0
+    if n <= 0:
+        n = min(4, os.cpu_count() or 1)
+    return max(1, n)
+
+
+def _parse_pdf_in_worker(pdf_path: str, max_pages: Optional[int]) -> str:
+    """子进程入口：必须是模块级函数才能被 pickle。"""
+    return PDFParser().parse_pdf(pdf_path, max_pages=max_pages)
+
+
 class OpenReviewIngestor:
     """
     OpenReview -> 本地知识库 的一条龙入库管线：
@@ -41,8 +59,14 @@ class OpenReviewIngestor:
         parse_pdfs: bool = True,
         max_pdf_pages: Optional[int] = 12,
         max_downloads: Optional[int] = None,
+        parse_workers: Optional[int] = None,
         on_progress: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
+        """
+        parse_workers: PDF 解析进程数（None=读取 MUJICA_PDF_PARSE_WORKERS，默认 min(4, CPU 数)；1=串行）。
+        自定义 parser（非 PDFParser 本身）始终在当前进程串行解析。
+        下载并发由 fetcher.download_pdfs 控制（MUJICA_PDF_DOWNLOAD_WORKERS）。
+        """
         # “追加抓取”模式：跳过已存在的论文 ID，直到凑够 limit 个新论文（或扫完）
         skip_ids = None
         if skip_existing:
@@ -50,9 +74,7 @@ class OpenReviewIngestor:
                 skip_ids = skip_paper_ids
             else:
                 try:
-                    df = self.kb.search_structured()
-                    if hasattr(df, "__len__") and (not df.empty) and ("id" in df.columns):  # type: ignore[attr-defined]
-                        skip_ids = set([str(x) for x in df["id"].tolist() if str(x).strip()])
+                    skip_ids = self.kb.get_existing_ids() or None
                 except Exception:
                     skip_ids = None
 
@@ -143,75 +165,149 @@ class OpenReviewIngestor:
         
         print(f"[Ingestor] Processing {total_papers} papers in {num_batches} batches (size={BATCH_SIZE})...")
 
-        for i in range(0, total_papers, BATCH_SIZE):
-            batch = papers[i : i + BATCH_SIZE]
-            batch_idx = (i // BATCH_SIZE) + 1
-            print(f"\n=== Processing Batch {batch_idx}/{num_batches} (Papers {i+1}~{min(i+BATCH_SIZE, total_papers)}) ===")
-
-            # 1. 下载 (Batch)
-            if download_pdfs:
-                self.fetcher.download_pdfs(
-                    batch, 
-                    max_downloads=len(batch), 
-                    on_progress=on_progress 
-                )
-
-            # 2. 解析 (Batch)
-            if parse_pdfs:
-                # 过滤出需要解析的
-                parse_targets = []
-                skipped_in_batch = 0
+        n_parse = parse_workers if parse_workers is not None else _parse_workers_default()
+        use_pool = parse_pdfs and n_parse > 1 and type(self.parser) is PDFParser
+        # 进程池跨 batch 复用（子进程启动要重新 import 依赖，代价不小）；首次需要解析时再创建
+        pool: Optional[ProcessPoolExecutor] = None
+        ingested_any = False
+
+        # 下载流水线：当前 batch 解析/入库时，后台线程已在下载下一个 batch 的 PDF，
+        # 网络不再在每个 batch 的解析/embedding 期间空闲（各 batch 的 paper dict 互不相交）
+        dl_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-prefetch") if download_pdfs else None
+
+        def _start_download(start: int) -> Optional[Future]:
+            if dl_pool is None or start >= total_papers:
+                return None
+            nxt = papers[start : start + BATCH_SIZE]
+            return dl_pool.submit(self.fetcher.download_pdfs, nxt, max_downloads=len(nxt), on_progress=on_progress)
+
+        try:
+            next_download = _start_download(0)
+            for i in range(0, total_papers, BATCH_SIZE):
+                batch = papers[i : i + BATCH_SIZE]
+                batch_idx = (i // BATCH_SIZE) + 1
+                print(f"\n=== Processing Batch {batch_idx}/{num_batches} (Papers {i+1}~{min(i+BATCH_SIZE, total_papers)}) ===")
+
+                # 1. 下载 (Batch)：等本批下载完成，并立即开始预取下一批
+                if next_download is not None:
+                    next_download.result()
+                    next_download = _start_download(i + BATCH_SIZE)
+
+                # 2. 解析 (Batch)
+                if parse_pdfs:
+                    # 过滤出需要解析的
+                    parse_targets = []
+                    skipped_in_batch = 0
+                    for p in batch:
+                        pid = str(p.get("id") or "")
+                        if pid in existing_ids_in_db:
+                            skipped_in_batch += 1
+                            continue
+                        if p.get("pdf_path") and os.path.exists(p.get("pdf_path")):
+                            parse_targets.append(p)
+                
+                    if skipped_in_batch > 0:
+                        print(f"[Batch {batch_idx}] Skipping parsing for {skipped_in_batch} already indexed papers.")
+
+                    # 执行解析
+                    pool, use_pool = self._parse_batch(
+                        parse_targets,
+                        max_pdf_pages=max_pdf_pages,
+                        wrap_progress=_wrap_progress,
+                        on_progress=on_progress,
+                        pool=pool,
+                        use_pool=use_pool,
+                        n_parse=n_parse,
+                    )
+                
+                    # 修正全局计数（把跳过的也算进 done，保证进度条走完）
+                    progress_state["parse_done"] += skipped_in_batch
+
+                # 3. 入库 (Batch) - 写入 DB
+                # 只对真正需要处理的论文调用 ingest_data（完全跳过已索引的论文）
+                papers_to_ingest = []
                 for p in batch:
                     pid = str(p.get("id") or "")
                     if pid in existing_ids_in_db:
-                        skipped_in_batch += 1
+                        # 完全跳过已索引的论文（避免重复 chunking/embedding meta/review 等）
                         continue
-                    if p.get("pdf_path") and os.path.exists(p.get("pdf_path")):
-                        parse_targets.append(p)
-                
-                if skipped_in_batch > 0:
-                    print(f"[Batch {batch_idx}] Skipping parsing for {skipped_in_batch} already indexed papers.")
-
-                # 执行解析
-                for p in parse_targets:
-                    # 包装一下 progress
-                    if callable(on_progress):
-                        try:
-                            # 模拟 trigger parse event
-                            _wrap_progress(
-                                "parse_pdf", 
-                                0, 0, 
-                                stage="parse_pdf", 
-                                paper_id=p.get("id"),
-                                title=p.get("title"),
-                                pdf_path=p.get("pdf_path")
-                            )
-                        except Exception:
-                            pass
-
-                    pdf_path = p.get("pdf_path")
-                    if pdf_path and os.path.exists(pdf_path):
-                        p["content"] = self.parser.parse_pdf(pdf_path, max_pages=max_pdf_pages)
-                
-                # 修正全局计数（把跳过的也算进 done，保证进度条走完）
-                progress_state["parse_done"] += skipped_in_batch
-
-            # 3. 入库 (Batch) - 写入 DB
-            # 只对真正需要处理的论文调用 ingest_data（完全跳过已索引的论文）
-            papers_to_ingest = []
-            for p in batch:
-                pid = str(p.get("id") or "")
-                if pid in existing_ids_in_db:
-                    # 完全跳过已索引的论文（避免重复 chunking/embedding meta/review 等）
-                    continue
-                papers_to_ingest.append(p)
+                    papers_to_ingest.append(p)
             
-            if papers_to_ingest:
-                print(f"[Batch {batch_idx}] Ingesting {len(papers_to_ingest)} new papers...")
-                self.kb.ingest_data(papers_to_ingest, on_progress=on_progress)
-            else:
-                print(f"[Batch {batch_idx}] All {len(batch)} papers already indexed. Skipping ingest.")
+                if papers_to_ingest:
+                    print(f"[Batch {batch_idx}] Ingesting {len(papers_to_ingest)} new papers...")
+                    # 向量索引不在每个 batch 后维护（optimize 是 O(表大小) 的），全部 batch 写完后统一处理一次
+                    self.kb.ingest_data(papers_to_ingest, on_progress=on_progress, build_index=False)
+                    ingested_any = True
+                else:
+                    print(f"[Batch {batch_idx}] All {len(batch)} papers already indexed. Skipping ingest.")
+
+            if ingested_any:
+                self.kb.ensure_chunk_index()
+
+        finally:
+            if dl_pool is not None:
+                # 出错/取消时不等后台预取：已在下载的那批下完即止
+                dl_pool.shutdown(wait=False, cancel_futures=True)
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
         return papers
 
+    def _parse_batch(
+        self,
+        parse_targets: List[Dict[str, Any]],
+        *,
+        max_pdf_pages: Optional[int],
+        wrap_progress: Any,
+        on_progress: Optional[Any],
+        pool: Optional[ProcessPoolExecutor],
+        use_pool: bool,
+        n_parse: int,
+    ) -> Tuple[Optional[ProcessPoolExecutor], bool]:
+        """
+        解析一个 batch 的 PDF，结果写回 p["content"]。
+        可用时走进程池（按完成顺序上报进度）；返回更新后的 (pool, use_pool)。
+        """
+        def _emit(p: Dict[str, Any]) -> None:
+            # 包装一下 progress
+            if callable(on_progress):
+                try:
+                    # 模拟 trigger parse event
+                    wrap_progress(
+                        "parse_pdf",
+                        0, 0,
+                        stage="parse_pdf",
+                        paper_id=p.get("id"),
+                        title=p.get("title"),
+                        pdf_path=p.get("pdf_path")
+                    )
+                except Exception:
+                    pass
+
+        pending = list(parse_targets)
+        if use_pool and len(pending) > 1:
+            # 已拿到结果的 paper（按 id() 记，避免每完成一个就 list.remove 线性扫一遍）
+            parsed: set = set()
+            try:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=n_parse)
+                futs = {pool.submit(_parse_pdf_in_worker, p["pdf_path"], max_pdf_pages): p for p in pending}
+                for fut in as_completed(futs):
+                    p = futs[fut]
+                    _emit(p)
+                    p["content"] = fut.result()
+                    parsed.add(id(p))
+            except (BrokenProcessPool, OSError) as e:
+                # 进程池不可用（受限环境 / 子进程崩溃）：剩余的退回串行解析，之后的 batch 也不再尝试
+                print(f"[Ingestor] Parallel PDF parsing unavailable ({e}); falling back to serial parsing.")
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                pool, use_pool = None, False
+            pending = [p for p in pending if id(p) not in parsed]
+
+        for p in pending:
+            _emit(p)
+            p["content"] = self.parser.parse_pdf(p["pdf_path"], max_pages=max_pdf_pages)
+        return pool, use_pool
+
 
@@ -2,6 +2,12 @@ import json
 import os
 from typing import List, Dict
 
+# orjson（C 实现）读写大 paper 列表快得多；未安装时回退标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class DataLoader:
     def __init__(self, data_path: str = "data/raw/sample_papers.json"):
         self.data_path = data_path
@@ -13,20 +19,35 @@ class DataLoader:
         if not os.path.exists(self.data_path):
             print(f"File not found: {self.data_path}")
             return []
-            
+
         try:
+            if orjson is not None:
+                with open(self.data_path, 'rb') as f:
+                    raw = f.read()
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # 标准库 json 写出的 NaN/Infinity 不是合法 JSON，orjson 拒收；交给 json 再解析一次
+                    return json.loads(raw)
             with open(self.data_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 return data
         except Exception as e:
             print(f"Error loading data: {e}")
             return []
-            
+
     def save_local_data(self, data: List[Dict]):
         """
         Saves data to a local JSON file.
         """
         os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        if orjson is not None:
+            # orjson 只支持 2 空格缩进，标准库分支也用 2 空格，常规数据两条路径写出的内容一致；
+            # 个别浮点数写法不同（1e16 vs 1e+16，NaN 在 orjson 下写成 null），读取时两边都能解析
+            with open(self.data_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # newline='\n'：Windows 上也不转成 \r\n，与 orjson 的输出保持一致
+            with open(self.data_path, 'w', encoding='utf-8', newline='\n') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"Saved {len(data)} papers to {self.data_path}")
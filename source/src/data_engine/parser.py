@@ -21,6 +21,9 @@ try:
 except Exception:
     fitz = None
 
+# PyMuPDF 没抽到文字时，只有不超过这么多页的短文档才再走 pdfplumber/PyPDF2 兜底
+_SLOW_FALLBACK_MAX_PAGES = 3
+
 
 def _env_truthy(name: str) -> bool:
     v = (os.getenv(name) or "").strip().lower()
@@ -57,8 +60,8 @@ class PDFParser:
         """
         Extracts text from a PDF file.
         """
-        if not PyPDF2 and not pdfplumber:
-            print("PyPDF2/pdfplumber not installed. Please install one of them to parse PDFs.")
+        if fitz is None and not PyPDF2 and not pdfplumber:
+            print("PyMuPDF/PyPDF2/pdfplumber not installed. Please install one of them to parse PDFs.")
             return ""
             
         if not os.path.exists(file_path):
@@ -67,21 +70,25 @@ class PDFParser:
 
         text = ""
         try:
-            # 0) 优先 PyMuPDF（更快且更少噪音）；若未安装则跳过
+            # 0) 优先 PyMuPDF（C 实现，更快且更少噪音）；若未安装则跳过
+            fitz_pages = None  # PyMuPDF 正常打开时实际读取的页数
             if fitz is not None:
                 try:
-                    doc = fitz.open(file_path)
-                    pages = range(min(len(doc), max_pages)) if max_pages else range(len(doc))
-                    out = []
-                    for i in pages:
-                        out.append((doc.load_page(i).get_text("text") or "").strip())
-                    doc.close()
+                    with fitz.open(file_path, filetype="pdf") as doc:
+                        n = min(len(doc), max_pages) if max_pages else len(doc)
+                        out = [(doc.load_page(i).get_text("text") or "").strip() for i in range(n)]
+                    fitz_pages = n
                     joined = "\n".join([x for x in out if x]).strip()
                     if joined:
                         return joined
                 except Exception:
                     # 继续 fallback
-                    pass
+                    fitz_pages = None
+
+            # PyMuPDF 能打开、但整份文档一个字都没抽到：基本是没有文字层的扫描件，
+            # pdfplumber/PyPDF2 读的是同一文字层，长文档上再跑一遍 pdfminer 版面分析只会慢 10-50 倍，直接放弃
+            if fitz_pages is not None and fitz_pages > _SLOW_FALLBACK_MAX_PAGES:
+                return ""
 
             # 优先用 pdfplumber（通常比 PyPDF2 提取效果更好）
             if pdfplumber:
@@ -107,6 +114,8 @@ class PDFParser:
                 # reset before PyPDF2
                 text = ""
 
+            if PyPDF2 is None:
+                return ""
             with open(file_path, 'rb') as f:
                 reader = PyPDF2.PdfReader(f)
                 pages = reader.pages[:max_pages] if max_pages else reader.pages
@@ -22,6 +22,21 @@ class KnowledgeBase:
     - SQLite：存结构化元数据（评分/作者/决策/评审等）
     """
 
+    # chunk 数少于该值时暴力扫描已足够快；超过后建 IVF_PQ 近似索引
+    ANN_INDEX_MIN_ROWS = 5000
+    # 查询时探测的 IVF 分区数 / 用原始向量重排的倍数（重排后 _distance 为精确值）
+    ANN_NPROBES = 20
+    ANN_REFINE_FACTOR = 10
+    # 已有索引时，未索引的新行累计到这么多才 optimize()：合并新行要重写索引（O(表大小)），不能每个 ingest batch 都做；
+    # 未索引的行检索时走暴力扫描，结果仍然完整
+    ANN_OPTIMIZE_MIN_UNINDEXED = 5000
+    # 分区数按建索引时的行数取 sqrt(N)；表增长到建索引时的这么多倍后按新行数重建索引
+    ANN_REBUILD_GROWTH = 4
+    # 索引名带上建索引时的行数（list_indices/index_stats 都拿不到分区数），供判断是否需要重建
+    ANN_INDEX_NAME_PREFIX = "vector_ivf_pq_rows"
+    # 检索结果只取这些列：不把每条命中的原始向量（1536 维 float32）搬进 Python
+    CHUNK_RESULT_COLUMNS = ["chunk_id", "paper_id", "source", "chunk_index", "text"]
+
     def __init__(
         self,
         db_path: str = "data/lancedb",
@@ -66,8 +81,20 @@ class KnowledgeBase:
         print(f"Connected to LanceDB at {self.db_path}")
 
         # SQLite
-        self._meta_conn = sqlite3.connect(self.metadata_path)
+        # 后端会在多个工作线程间共享同一个 KnowledgeBase（以读为主），因此允许跨线程使用该连接；
+        # sqlite3 模块本身是 serialized 模式，单条语句的执行是线程安全的。
+        self._meta_conn = sqlite3.connect(self.metadata_path, check_same_thread=False)
         self._meta_conn.row_factory = sqlite3.Row
+        # WAL：读不阻塞写（后端读接口与 ingest 任务并发）；journal_mode 持久化在库文件里
+        try:
+            self._meta_conn.execute("PRAGMA journal_mode=WAL")
+            self._meta_conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError:
+            pass
+        # 以下为连接级设置：64 MB 页缓存、256 MB mmap（读直接走 OS page cache）、临时表/排序放内存
+        self._meta_conn.execute("PRAGMA cache_size=-65536")
+        self._meta_conn.execute("PRAGMA mmap_size=268435456")
+        self._meta_conn.execute("PRAGMA temp_store=MEMORY")
         self._init_metadata_schema()
         self.metadata_df = self._load_metadata_df()
 
@@ -118,8 +145,16 @@ class KnowledgeBase:
             """
         )
         cur.execute("CREATE INDEX IF NOT EXISTS idx_reviews_paper_id ON reviews(paper_id)")
+        # 规划统计会对这些列做 DISTINCT 扫描；建索引后可走 index-only scan
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_papers_year ON papers(year)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_papers_decision ON papers(decision)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_papers_venue ON papers(venue_id)")
+        # 论文列表按 updated_at DESC 分页；有索引时 ORDER BY ... LIMIT 不再需要全表排序
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_papers_updated ON papers(updated_at DESC)")
         self._meta_conn.commit()
 
+        self._init_fts_schema()
+
         # schema migrate：为旧库补齐新列
         try:
             cols = [r["name"] for r in cur.execute("PRAGMA table_info(papers)").fetchall()]
@@ -132,6 +167,9 @@ class KnowledgeBase:
             if "rebuttal_text" not in cols:
                 cur.execute("ALTER TABLE papers ADD COLUMN rebuttal_text TEXT")
                 self._meta_conn.commit()
+            if "search_blob" not in cols:
+                cur.execute("ALTER TABLE papers ADD COLUMN search_blob TEXT")
+                self._meta_conn.commit()
         except Exception:
             # 忽略迁移失败（最坏情况：不会存 presentation）
             pass
@@ -146,10 +184,137 @@ class KnowledgeBase:
             # 忽略迁移失败（最坏情况：只保留 raw_json）
             pass
 
+        self._init_search_blob()
+        self._init_author_index()
+
+    def _init_author_index(self) -> None:
+        """
+        paper_authors(paper_id, idx, name)：authors_json 的展开表，详情页直接按序取作者、
+        也可按作者名查论文。由触发器（json_each）维护，首次建表时从 papers 回填。
+        """
+        assert self._meta_conn is not None
+        cur = self._meta_conn.cursor()
+        # authors_json 可能为空/非法；非法 JSON 会让 json_each 报错进而拖垮写入，这里统一兜底成 '[]'
+        authors_src = "json_each(CASE WHEN json_valid({col}) THEN {col} ELSE '[]' END)"
+        insert_sql = (
+            "INSERT OR IGNORE INTO paper_authors(paper_id, idx, name) "
+            "SELECT {pid}, CAST(key AS INTEGER), value FROM " + authors_src + " WHERE type = 'text'"
+        )
+        try:
+            existed = cur.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='paper_authors'"
+            ).fetchone()
+            cur.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS paper_authors (
+                    paper_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    PRIMARY KEY (paper_id, idx)
+                );
+                CREATE INDEX IF NOT EXISTS idx_paper_authors_name ON paper_authors(name COLLATE NOCASE);
+                CREATE TRIGGER IF NOT EXISTS papers_authors_ai AFTER INSERT ON papers BEGIN
+                    {insert_sql.format(pid="new.id", col="new.authors_json")};
+                END;
+                CREATE TRIGGER IF NOT EXISTS papers_authors_ad AFTER DELETE ON papers BEGIN
+                    DELETE FROM paper_authors WHERE paper_id = old.id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS papers_authors_au AFTER UPDATE OF authors_json ON papers BEGIN
+                    DELETE FROM paper_authors WHERE paper_id = old.id;
+                    {insert_sql.format(pid="new.id", col="new.authors_json")};
+                END;
+                """
+            )
+            if not existed:
+                cur.execute(
+                    "INSERT OR IGNORE INTO paper_authors(paper_id, idx, name) "
+                    "SELECT p.id, CAST(j.key AS INTEGER), j.value FROM papers p, "
+                    + authors_src.format(col="p.authors_json")
+                    + " AS j WHERE j.type = 'text'"
+                )
+            self._meta_conn.commit()
+        except sqlite3.OperationalError as e:
+            print(f"paper_authors init failed (authors fall back to authors_json): {e}")
+
+    def _init_search_blob(self) -> None:
+        """
+        search_blob = LOWER(title || ' ' || abstract)，供 LIKE 兜底检索只扫一列。
+        由触发器维护（导入合并的旧库也能自动补齐），首次迁移时回填。
+        """
+        assert self._meta_conn is not None
+        cur = self._meta_conn.cursor()
+        try:
+            cur.executescript(
+                """
+                CREATE TRIGGER IF NOT EXISTS papers_search_blob_ai AFTER INSERT ON papers BEGIN
+                    UPDATE papers SET search_blob = LOWER(COALESCE(new.title, '') || ' ' || COALESCE(new.abstract, ''))
+                    WHERE rowid = new.rowid;
+                END;
+                CREATE TRIGGER IF NOT EXISTS papers_search_blob_au AFTER UPDATE OF title, abstract ON papers BEGIN
+                    UPDATE papers SET search_blob = LOWER(COALESCE(new.title, '') || ' ' || COALESCE(new.abstract, ''))
+                    WHERE rowid = new.rowid;
+                END;
+                """
+            )
+            cur.execute(
+                "UPDATE papers SET search_blob = LOWER(COALESCE(title, '') || ' ' || COALESCE(abstract, '')) "
+                "WHERE search_blob IS NULL"
+            )
+            self._meta_conn.commit()
+        except sqlite3.OperationalError as e:
+            print(f"search_blob init failed (LIKE search falls back to title/abstract): {e}")
+
+    def _init_fts_schema(self) -> None:
+        """
+        标题/摘要全文索引（FTS5 external content 表，指向 papers.rowid），由触发器保持同步。
+        SQLite 未编译 FTS5 时静默跳过，上层检索会退回 LIKE。
+        """
+        assert self._meta_conn is not None
+        cur = self._meta_conn.cursor()
+        try:
+            existed = cur.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='papers_fts'"
+            ).fetchone()
+            cur.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                    title, abstract, content='papers', content_rowid='rowid', tokenize='porter unicode61'
+                )
+                """
+            )
+            cur.executescript(
+                """
+                CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+                    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+                END;
+                CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+                    INSERT INTO papers_fts(papers_fts, rowid, title, abstract)
+                    VALUES ('delete', old.rowid, old.title, old.abstract);
+                END;
+                CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE OF title, abstract ON papers BEGIN
+                    INSERT INTO papers_fts(papers_fts, rowid, title, abstract)
+                    VALUES ('delete', old.rowid, old.title, old.abstract);
+                    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+                END;
+                """
+            )
+            if not existed:
+                # 旧库首次建索引：从 papers 回填
+                cur.execute("INSERT INTO papers_fts(papers_fts) VALUES ('rebuild')")
+            self._meta_conn.commit()
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 unavailable, full-text search disabled: {e}")
+
     # ---------------------------
     # Ingest
     # ---------------------------
-    def ingest_data(self, papers: List[Dict[str, Any]], *, on_progress: Optional[Any] = None) -> None:
+    def ingest_data(
+        self,
+        papers: List[Dict[str, Any]],
+        *,
+        on_progress: Optional[Any] = None,
+        build_index: bool = True,
+    ) -> None:
         """
         Ingest 论文到知识库。
 
@@ -157,6 +322,8 @@ class KnowledgeBase:
         - `rating`：论文评分（float 或 None）
         - `content`：全文/解析文本（可选）
         - `reviews`：评审列表（可选）
+
+        build_index=False：不在本次写入后维护向量索引（分批 ingest 时由调用方在全部批次结束后调用 ensure_chunk_index）。
         """
         if not papers:
             print("No papers to ingest.")
@@ -694,11 +861,83 @@ class KnowledgeBase:
                     self.db.open_table(self.chunks_table).add(rows_to_insert)
                 else:
                     self.db.create_table(self.chunks_table, data=rows_to_insert)
+                if build_index:
+                    self.ensure_chunk_index()
 
         # 4) 刷新 metadata_df
         self.metadata_df = self._load_metadata_df()
         print(f"[OK] Ingested {len(papers)} papers (metadata) into SQLite and vectors into LanceDB.")
 
+    def ensure_chunk_index(self) -> Optional[str]:
+        """
+        为 chunk 表的 vector 列维护 IVF_PQ 近似索引，避免语义检索每次全量暴力扫描。
+        - 行数不足 ANN_INDEX_MIN_ROWS：不建索引（暴力扫描更快也更准）
+        - 尚无索引：按 sqrt(N) 个分区新建（每个分区至少需要 256 条训练样本）
+        - 行数已增长到建索引时的 ANN_REBUILD_GROWTH 倍：按当前行数重建（先建新索引再删旧的，期间检索不退化）
+        - 未索引的新增行达到 ANN_OPTIMIZE_MIN_UNINDEXED：optimize() 把新行并入索引
+        返回本次执行的动作（"created" / "rebuilt" / "optimized"），无操作时返回 None。
+        """
+        if self.db is None or self.chunks_table not in self.db.table_names():
+            return None
+        try:
+            tbl = self.db.open_table(self.chunks_table)
+            indices = [ix for ix in tbl.list_indices() if "vector" in (ix.columns or [])]
+            n = tbl.count_rows()
+            old_index = None
+            if indices:
+                old_index = indices[0].name
+                stats = tbl.index_stats(old_index)
+                built_rows = self._ann_index_built_rows(old_index)
+                if built_rows is None:
+                    # 旧版本建的索引名里没有行数：以已索引行数近似
+                    built_rows = stats.num_indexed_rows if stats else 0
+                if not (built_rows and n >= built_rows * self.ANN_REBUILD_GROWTH):
+                    if stats and stats.num_unindexed_rows >= self.ANN_OPTIMIZE_MIN_UNINDEXED:
+                        tbl.optimize()
+                        return "optimized"
+                    return None
+            elif n < self.ANN_INDEX_MIN_ROWS:
+                return None
+
+            # 距离保持 L2，与无索引时的暴力检索一致（上层按 L2 距离换算相似度）
+            tbl.create_index(
+                metric="l2",
+                vector_column_name="vector",
+                index_type="IVF_PQ",
+                num_partitions=max(1, min(int(math.sqrt(n)), n // 256)),
+                name=f"{self.ANN_INDEX_NAME_PREFIX}{n}",
+            )
+            if old_index is not None:
+                tbl.drop_index(old_index)
+                print(f"[OK] Rebuilt IVF_PQ index on {self.chunks_table} ({n} chunks)")
+                return "rebuilt"
+            print(f"[OK] Built IVF_PQ index on {self.chunks_table} ({n} chunks)")
+            return "created"
+        except Exception as e:
+            print(f"Warning: failed to build chunk vector index: {e}")
+            return None
+
+    def _ann_index_built_rows(self, index_name: str) -> Optional[int]:
+        """从索引名解析建索引时的行数；不是本类命名的索引返回 None。"""
+        if not (index_name or "").startswith(self.ANN_INDEX_NAME_PREFIX):
+            return None
+        try:
+            return int(index_name[len(self.ANN_INDEX_NAME_PREFIX):])
+        except ValueError:
+            return None
+
+    def _search_chunk_vectors(self, tbl: Any, vector: List[float], limit: int) -> List[Dict[str, Any]]:
+        """chunk 向量检索；有 IVF 索引时 nprobes/refine_factor 生效，无索引时为暴力扫描。"""
+        return (
+            tbl.search(vector)
+            # _distance 要显式列出：指定了输出列时 LanceDB 将不再自动附带它（上层按它排序/换算相似度）
+            .select([c for c in self.CHUNK_RESULT_COLUMNS if c in tbl.schema.names] + ["_distance"])
+            .nprobes(self.ANN_NPROBES)
+            .refine_factor(self.ANN_REFINE_FACTOR)
+            .limit(limit)
+            .to_list()
+        )
+
     def get_paper_ids_with_content(self) -> set[str]:
         """
         获取已存在全文索引(full_text)的 paper_id 集合。
@@ -906,6 +1145,16 @@ class KnowledgeBase:
             out[d["id"]] = d
         return out
 
+    def get_existing_ids(self) -> set[str]:
+        """
+        已入库的全部 paper_id（只查 papers.id 一列，不构建 metadata DataFrame）。
+        用于“追加抓取”时跳过已存在的论文。
+        """
+        if self._meta_conn is None:
+            return set()
+        rows = self._meta_conn.execute("SELECT id FROM papers").fetchall()
+        return {str(r[0]) for r in rows if r[0] is not None and str(r[0]).strip()}
+
     def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
         if not paper_id or self._meta_conn is None:
             return None
@@ -1228,7 +1477,7 @@ class KnowledgeBase:
             return []
 
         tbl = self.db.open_table(self.chunks_table)
-        hits = tbl.search(qv).limit(limit).to_list()
+        hits = self._search_chunk_vectors(tbl, qv, limit)
         if not hits:
             return []
 
@@ -1297,7 +1546,7 @@ class KnowledgeBase:
         if self.chunks_table in self.db.table_names():
             tbl = self.db.open_table(self.chunks_table)
             # 多取一些 chunk，聚合后再截断
-            raw = tbl.search(query_vector).limit(max(limit * 8, 20)).to_list()
+            raw = self._search_chunk_vectors(tbl, query_vector, max(limit * 8, 20))
             if not raw:
                 return []
 
@@ -48,26 +48,59 @@ def _index_path() -> Path:
     return _history_dir() / "index.json"
 
 
+def _write_text_atomic(p: Path, text: str) -> None:
+    # 先写临时文件再 os.replace，避免进程中途退出留下半截 JSON
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, p)
+
+
+# 解析后的 index 按 (inode, mtime_ns, size) 缓存；历史列表轮询时不必每次重新 json.loads
+_index_cache: Dict[str, Any] = {"key": None, "items": []}
+
+
 def load_index() -> List[Dict[str, Any]]:
     p = _index_path()
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         return []
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if _index_cache["key"] == key:
+        return list(_index_cache["items"])
     try:
         data = json.loads(p.read_text(encoding="utf-8"))
-        return data if isinstance(data, list) else []
+        items = data if isinstance(data, list) else []
     except Exception:
         return []
+    _index_cache["key"], _index_cache["items"] = key, items
+    return list(items)
 
 
 def save_index(items: List[Dict[str, Any]]) -> None:
     p = _index_path()
     try:
-        p.write_text(json.dumps(items or [], ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_text_atomic(p, json.dumps(items or [], ensure_ascii=False, indent=2))
     except Exception:
         # best-effort persistence
         return
 
 
+def _upsert_index(meta: Dict[str, Any]) -> None:
+    cid = meta.get("cid")
+    out: List[Dict[str, Any]] = []
+    found = False
+    for it in load_index():
+        if isinstance(it, dict) and it.get("cid") == cid:
+            out.append(meta)
+            found = True
+        else:
+            out.append(it if isinstance(it, dict) else {})
+    if not found:
+        out.append(meta)
+    save_index(out)
+
+
 def list_conversations(limit: int = 100) -> List[Dict[str, Any]]:
     items = load_index()
     # sort by updated_ts desc
@@ -112,23 +145,12 @@ def save_conversation(cid: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
     # write conversation file
     try:
         payload = {"meta": meta, "snapshot": data}
-        _conv_path(cid).write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        _write_text_atomic(_conv_path(cid), json.dumps(payload, ensure_ascii=False))
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
     # update index (upsert)
-    items = load_index()
-    out: List[Dict[str, Any]] = []
-    found = False
-    for it in items:
-        if isinstance(it, dict) and it.get("cid") == cid:
-            out.append(meta)
-            found = True
-        else:
-            out.append(it if isinstance(it, dict) else {})
-    if not found:
-        out.append(meta)
-    save_index(out)
+    _upsert_index(meta)
     return {"ok": True, "meta": meta}
 
 
@@ -155,16 +177,19 @@ def rename_conversation(cid: str, new_title: str) -> Dict[str, Any]:
     if not title:
         return {"ok": False, "error": "empty title"}
 
-    now = _now_ts()
     p = _conv_path(cid)
+    if not p.exists():
+        # 不存在的对话不要凭空创建一个空文件
+        return {"ok": False, "error": "not found"}
+
+    now = _now_ts()
     payload: Dict[str, Any] = {}
-    if p.exists():
-        try:
-            raw = json.loads(p.read_text(encoding="utf-8"))
-            if isinstance(raw, dict):
-                payload = raw
-        except Exception:
-            payload = {}
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+        if isinstance(raw, dict):
+            payload = raw
+    except Exception:
+        payload = {}
 
     snap = payload.get("snapshot") if isinstance(payload, dict) else None
     if not isinstance(snap, dict):
@@ -185,23 +210,12 @@ def rename_conversation(cid: str, new_title: str) -> Dict[str, Any]:
         snap["created_ts"] = created_ts
 
     try:
-        p.write_text(json.dumps({"meta": meta2, "snapshot": snap}, ensure_ascii=False), encoding="utf-8")
+        _write_text_atomic(p, json.dumps({"meta": meta2, "snapshot": snap}, ensure_ascii=False))
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
     # update index
-    items = load_index()
-    out: List[Dict[str, Any]] = []
-    found = False
-    for it in items:
-        if isinstance(it, dict) and it.get("cid") == cid:
-            out.append(meta2)
-            found = True
-        else:
-            out.append(it if isinstance(it, dict) else {})
-    if not found:
-        out.append(meta2)
-    save_index(out)
+    _upsert_index(meta2)
 
     return {"ok": True, "meta": meta2}
 
@@ -40,3 +40,33 @@ def test_kb_ingest_and_search_offline(tmp_path, monkeypatch):
     assert "id" in hits[0] and "best_chunk" in hits[0]
 
 
+def test_kb_fts_index_tracks_papers(tmp_path, monkeypatch):
+    monkeypatch.setenv("MUJICA_FAKE_EMBEDDINGS", "1")
+    monkeypatch.setenv("MUJICA_FAKE_EMBEDDING_DIM", "64")
+
+    kb = KnowledgeBase(db_path=str(tmp_path / "lancedb_kb"))
+    kb.initialize_db()
+    kb.ingest_data(
+        [
+            {"id": "p1", "title": "Deep Learning for Alignment", "abstract": "RLHF and DPO."},
+            {"id": "p2", "title": "Graph Neural Networks", "abstract": "Molecular properties."},
+        ]
+    )
+
+    def _match(q):
+        rows = kb._meta_conn.execute(
+            "SELECT p.id FROM papers_fts f JOIN papers p ON p.rowid = f.rowid WHERE papers_fts MATCH ?",
+            (q,),
+        ).fetchall()
+        return {r["id"] for r in rows}
+
+    assert _match('"align"*') == {"p1"}
+    assert _match('"molecular"') == {"p2"}
+
+    # upsert 更新标题后，索引同步
+    kb.ingest_data([{"id": "p2", "title": "Transformers for Chemistry", "abstract": "Molecular properties."}])
+    assert _match('"graph"') == set()
+    assert _match('"chemistry"') == {"p2"}
+
+    kb.delete_paper("p1")
+    assert _match('"align"*') == set()
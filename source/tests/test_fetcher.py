@@ -0,0 +1,106 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from src.data_engine import fetcher
+from src.data_engine.fetcher import _AdaptiveLimit, _backoff_delay, _retry_after_seconds
+
+
+class _FakeResp:
+    def __init__(self, status_code: int, retry_after=None):
+        self.status_code = status_code
+        self.headers = {} if retry_after is None else {"Retry-After": retry_after}
+
+
+def test_retry_after_parses_seconds_and_http_date():
+    assert _retry_after_seconds(_FakeResp(429, "7")) == 7.0
+    assert _retry_after_seconds(_FakeResp(429)) is None
+    assert _retry_after_seconds(_FakeResp(429, "not a date")) is None
+
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25.0 <= _retry_after_seconds(_FakeResp(503, future)) <= 30.0
+
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+    assert _retry_after_seconds(_FakeResp(503, past)) == 0.0
+
+
+def test_backoff_honours_retry_after_up_to_cap():
+    assert _backoff_delay(1.0, _FakeResp(429, "20")) >= 20.0
+    assert _backoff_delay(1.0, _FakeResp(429, "999")) == 60.0
+    # 抖动本身也不超过 cap
+    assert _backoff_delay(1000.0) == 60.0
+
+
+def test_backoff_gives_up_on_client_errors():
+    for code in (401, 403, 404):
+        assert _backoff_delay(1.0, _FakeResp(code)) is None
+
+
+def test_backoff_jitter_stays_within_bounds():
+    for prev in (1.0, 2.0, 5.0):
+        for _ in range(200):
+            assert 1.0 <= _backoff_delay(prev) <= prev * 3
+
+
+def test_adaptive_limit_halves_once_per_second(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(fetcher.time, "monotonic", lambda: clock[0])
+    lim = _AdaptiveLimit(8)
+
+    lim.shrink()
+    assert lim.limit == 4
+    # 同一波限流里的其它失败不再继续减半
+    clock[0] += 0.5
+    lim.shrink()
+    assert lim.limit == 4
+
+    clock[0] += 1.0
+    lim.shrink()
+    assert lim.limit == 2
+    for _ in range(3):
+        clock[0] += 2.0
+        lim.shrink()
+    assert lim.limit == 1
+
+
+def test_adaptive_limit_grows_back_to_max():
+    lim = _AdaptiveLimit(3, grow_after=2)
+    lim.limit = 1
+
+    lim.success()
+    assert lim.limit == 1
+    lim.success()
+    assert lim.limit == 2
+    for _ in range(10):
+        lim.success()
+    assert lim.limit == 3
+
+
+def test_adaptive_limit_slot_blocks_at_limit():
+    lim = _AdaptiveLimit(2)
+    lim.limit = 1
+    held = threading.Event()
+    release = threading.Event()
+    entered = threading.Event()
+
+    def holder():
+        with lim.slot():
+            held.set()
+            release.wait(5)
+
+    def waiter():
+        with lim.slot():
+            entered.set()
+
+    t1 = threading.Thread(target=holder)
+    t1.start()
+    assert held.wait(5)
+    t2 = threading.Thread(target=waiter)
+    t2.start()
+
+    assert not entered.wait(0.2)
+    release.set()
+    assert entered.wait(5)
+    t1.join(5)
+    t2.join(5)
+    assert lim._in_use == 0